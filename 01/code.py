@@ -1,40 +1,20 @@
-import argparse
-from time import time
+import os
+import sys
 import json
 import math
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heapreplace, nlargest
+from itertools import chain
 
-DAY = 1
-
-PUZZLE_TEXT = '''
-https://adventofcode.com/2022/day/1
-
---- Day 1: Calorie Counting ---
-
-Santa's reindeer typically eat regular reindeer food, but they need a lot of magical 
-energy to deliver presents on Christmas. For that, their favorite snack is a special 
-type of star fruit that only grows deep in the jungle. The Elves have brought you on 
-their annual expedition to the grove where the fruit grows.
-
-To supply enough magical energy, the expedition needs to retrieve a minimum of fifty 
-stars by December 25th. Although the Elves assure you that the grove has plenty of 
-fruit, you decide to grab any fruit you see along the way, just in case.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-Collect stars by solving puzzles. Two puzzles will be made available on each day in 
-the Advent calendar; the second puzzle is unlocked when you complete the first. Each 
-puzzle grants one star. Good luck!
+from aoc.inputs import PuzzleInput, lines
 
-The jungle must be too overgrown and difficult to navigate in vehicles or access from 
-the air; the Elves' expedition traditionally goes on foot. As your boats approach 
-land, the Elves begin taking inventory of their supplies. One important consideration 
-is food - in particular, the number of Calories each Elf is carrying (your puzzle input).
-
-The Elves take turns writing down the number of Calories contained by the various meals, 
-snacks, rations, etc. that they've brought with them, one item per line. Each Elf 
-separates their own inventory from the previous Elf's inventory (if any) by a blank line.
+DAY = 1
 
-For example, suppose the Elves finish writing their items' Calories and end up with the 
-following list:
+STREAMING_INPUT = True
 
+SAMPLE_INPUT = '''
 1000
 2000
 3000
@@ -49,145 +29,343 @@ following list:
 9000
 
 10000
-This list represents the Calories of the food carried by five Elves:
-
-The first Elf is carrying food with 1000, 2000, and 3000 Calories, a total of 6000 
-Calories.
-The second Elf is carrying one food item with 4000 Calories.
-The third Elf is carrying food with 5000 and 6000 Calories, a total of 11000 Calories.
-The fourth Elf is carrying food with 7000, 8000, and 9000 Calories, a total of 24000 
-Calories.
-The fifth Elf is carrying one food item with 10000 Calories.
-
-In case the Elves get hungry and need extra snacks, they need to know which Elf to ask: 
-they'd like to know how many Calories are being carried by the Elf carrying the most 
-Calories. In the example above, this is 24000 (carried by the fourth Elf).
-
-Find the Elf carrying the most Calories. How many total Calories is that Elf carrying?
 '''
 
-SAMPLE_INPUT = '''
-1000
-2000
-3000
+P1_SAMPLE_SOLUTION = 24000
 
-4000
+P2_SAMPLE_SOLUTION = 45000
 
-5000
-6000
+# Chunk-parallel inputs are cut into pieces of about this size, and files
+# smaller than one piece aren't worth starting worker processes for.
+CHUNK_BYTES = 32 * 1024 * 1024
 
-7000
-8000
-9000
+# The numpy engine parses its input this much at a time.
+NUMPY_BLOCK_BYTES = 1024 * 1024
 
-10000
-'''
+# Appended input is read in blocks of this size.
+APPEND_BYTES = 1024 * 1024
 
-P1_SAMPLE_SOLUTION = 24000
+class Puzzle():
+    def __init__(self,input_text):
+        self.input_text = input_text
+        self.calories_per_elf = []
+        calories = 0
+        for row in chain(lines(input_text), [""]): # trailing "" closes the last elf
+            try:
+                calories += int(row)
+            except ValueError:
+                self.calories_per_elf.append(calories)
+                calories = 0
 
-P2_SAMPLE_SOLUTION = 45000
+    def p1(self):
+        self.p1_solution = max(self.calories_per_elf)
 
-def elapsed_time(start_time):
-    return f"{round(time() - start_time, 8)}s\n"
+    def p2(self):
+        top_three = sorted(self.calories_per_elf)[-3:]
+        self.p2_solution = sum(top_three)
 
-def part_one(input_text=SAMPLE_INPUT):
-    input_list = input_text.lstrip().rstrip().split('\n')
-    
-    calories_per_elf = { }
-    
+def elf_totals(source):
+    """Yield each elf's total calories from `source`, one line at a time."""
     calories = 0
-    highest_calorie_count = {"elf": 0, "calories": 0}
-    for row in input_list:
-        try:
+    for row in chain(lines(source), [""]): # trailing "" closes the last elf
+        if row:
             calories += int(row)
-        except ValueError:
-            calories_per_elf[len(calories_per_elf)] = calories
-            if calories > highest_calorie_count["calories"]:
-                highest_calorie_count = {"elf": len(calories_per_elf), "calories": calories}
+        else:
+            yield calories
             calories = 0
-    
-    return int(highest_calorie_count["calories"])
 
-def part_two(input_text=SAMPLE_INPUT):
-    input_list = input_text.lstrip().rstrip().split('\n')
-    
-    calories_per_elf = []
-    calories = 0
-    for row in input_list:
-        try:
+def top_totals(source, k=3):
+    """The `k` largest elf totals in `source`, largest first, from one pass
+    that holds only a k-item heap (heapq.nlargest) instead of every total."""
+    return nlargest(k, elf_totals(source))
+
+class TopTotalsPuzzle(Puzzle):
+    """Same answers as Puzzle from one streaming pass keeping the top `k`
+    totals, so memory stays O(k) however many elves the input lists."""
+
+    k = 3
+
+    def __init__(self,input_text):
+        self.input_text = input_text
+        self.top = top_totals(input_text, max(self.k, 3))
+
+    def p1(self):
+        self.p1_solution = self.top[0]
+
+    def p2(self):
+        self.p2_solution = sum(self.top[:3])
+
+def chunk_ranges(data, chunks):
+    """(start, end) byte ranges cutting `data` (bytes or an mmap) into about
+    `chunks` pieces, each ending just after a newline so no line is split."""
+    bounds = [0]
+    for piece in range(1, chunks):
+        cut = data.find(b"\n", max(bounds[-1], len(data) * piece // chunks))
+        bounds.append(len(data) if cut == -1 else cut + 1)
+    bounds.append(len(data))
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+def chunk_summary(chunk, k):
+    """(head, top, tail) for one chunk of whole lines: the calories before its
+    first blank line (the end of an elf begun in an earlier chunk), the `k`
+    largest totals of the elves wholly inside it, and the calories after its
+    last blank line (an elf carried into the next chunk). head is None when
+    the chunk has no blank line, so all of it belongs to one elf's middle."""
+    rows = chunk.split(b"\n")
+    if chunk.endswith(b"\n"):
+        rows.pop() # the split's empty tail, not a blank line
+    head, totals, calories = None, [], 0
+    for row in rows:
+        if row.strip():
             calories += int(row)
-        except ValueError:
-            calories_per_elf.append(calories)
+        elif head is None:
+            head, calories = calories, 0
+        else:
+            totals.append(calories)
             calories = 0
-    
-    calories_per_elf.append(calories)
-    
-    calories_per_elf.sort()
-    
-    top_three = calories_per_elf.pop() + calories_per_elf.pop() + calories_per_elf.pop()
-    
-    return top_three
-        
+    return head, nlargest(k, totals), calories
 
-def main():
-    parser = argparse.ArgumentParser(description=f'AOC2022 Puzzle Day { DAY }')
-    parser.add_argument("-p", "--showpuzzle", help="Display Puzzle Text", action='store_true')
-    parser.add_argument("-s", "--showsample", help="Display Sample Input", action='store_true')
-    parser.add_argument("-t", "--testsample", help="Test Sample Input", action='store_true')
-    parser.add_argument("-i", "--inputfile", help="Puzzle Input", type=str)
-    args = parser.parse_args()
-    
-    if args.showpuzzle:
-        print(f"###############\nAOC 2022 DAY {DAY} PUZZLE TEXT\n###############")
-        print(PUZZLE_TEXT)
-    
-    if args.showsample:
-        print(f"###############\nAOC 2022 DAY {DAY} SAMPLE INPUT\n###############")
-        print(SAMPLE_INPUT.lstrip())
-        print(f"\n###############\nAOC 2022 DAY {DAY} P1 SAMPLE SOLUTION\n###############")
-        print(P1_SAMPLE_SOLUTION)
-        print(f"\n###############\nAOC 2022 DAY {DAY} P2 SAMPLE SOLUTION\n###############")
-        print(P2_SAMPLE_SOLUTION)
-    
-    if args.inputfile:        
-        try:
-            my_input = ""
-            with open(args.inputfile, 'r') as file:
-                while (line := file.readline()):
-                    my_input += line            
-        except FileNotFoundError:
-            print("Specified input file not found.")
-            quit()
-
-    if P1_SAMPLE_SOLUTION:            
-        print("PART 1\nTesting Sample...\n")
-        start_time = time()
-        solution_output = part_one()
-        if P1_SAMPLE_SOLUTION == solution_output:
-            print("Sample correct.")
+def file_chunk_summary(path, start, end, k):
+    # Run in a worker: each maps the file itself and reads only its range.
+    with PuzzleInput.from_file(path).buffer() as mapped:
+        return chunk_summary(mapped[start:end], k)
+
+def merge_summaries(summaries, k):
+    """Stitch the elves cut by chunk edges back together, in chunk order, and
+    take the `k` largest of those and every chunk's own top k."""
+    candidates, carried = [], 0
+    for head, top, tail in summaries:
+        if head is None:
+            carried += tail
+            continue
+        candidates.append(carried + head)
+        candidates.extend(top)
+        carried = tail
+    candidates.append(carried)
+    return nlargest(k, candidates)
+
+def chunked_top_totals(source, k=3, jobs=None):
+    """top_totals() computed over chunks of the input, in `jobs` worker
+    processes (default: one per CPU) for files of more than CHUNK_BYTES."""
+    jobs = jobs or os.cpu_count() or 1
+    if not isinstance(source, PuzzleInput):
+        source = PuzzleInput.from_text(source)
+    with source.buffer() as data:
+        # Text is still cut into chunks, just summarised in this process.
+        ranges = chunk_ranges(data, max(jobs, 2, -(-len(data) // CHUNK_BYTES)))
+        if jobs == 1 or len(data) <= CHUNK_BYTES or not source.path:
+            summaries = [chunk_summary(data[start:end], k) for start, end in ranges]
+            return merge_summaries(summaries, k)
+    from aoc.days import call_day
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(call_day, DAY, "file_chunk_summary", source.path, start, end, k)
+            for start, end in ranges
+        ]
+        return merge_summaries([future.result() for future in futures], k)
+
+class ChunkedPuzzle(TopTotalsPuzzle):
+    """TopTotalsPuzzle over byte ranges of the mapped input file, summarised
+    in parallel by `jobs` worker processes and stitched back together."""
+
+    def __init__(self,input_text,jobs=None):
+        self.input_text = input_text
+        self.top = chunked_top_totals(input_text, max(self.k, 3), jobs)
+
+def numpy_chunk_summary(chunk, k):
+    """chunk_summary() with the lines parsed by numpy: every line's digits
+    are gathered a place value at a time (ones, then tens, ...) across all
+    lines at once, so only per-line arrays are allocated. A chunk holding
+    anything but digits and line endings (spaces, signs) or lines too long
+    for int64 sums is left to chunk_summary()."""
+    import numpy as np
+
+    if chunk.translate(None, b"0123456789\r\n"):
+        return chunk_summary(chunk, k)
+    if b"\r" in chunk:
+        chunk = chunk.replace(b"\r", b"")
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    ends = np.flatnonzero(data == ord("\n")).astype(np.int32)
+    if not chunk.endswith(b"\n"):
+        ends = np.append(ends, np.int32(len(data)))
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int32)
+    lengths = ends - starts
+    longest = int(lengths.max(initial=0))
+    if longest > 12:
+        # Past 12 digits the int64 sums of a block's lines could overflow.
+        return chunk_summary(chunk, k)
+    lengths = lengths.astype(np.uint8)
+    values = np.zeros(len(ends), dtype=np.int64)
+    for place in range(longest):
+        # Lines shorter than this gather some other byte, masked out here.
+        digits = np.where(lengths > place, data[ends - 1 - place] - ord("0"), 0)
+        values += digits.astype(np.int64) * 10 ** place
+    blanks = np.flatnonzero(lengths == 0)
+    if not len(blanks):
+        return None, [], int(values.sum())
+    # Blank lines are worth 0, so each elf's segment can start on the blank
+    # line that closed the elf before it.
+    inner = values[:0]
+    if len(blanks) > 1:
+        inner = np.add.reduceat(values[: blanks[-1]], blanks[:-1])
+    head, tail = values[: blanks[0]].sum(), values[blanks[-1] + 1 :].sum()
+    return int(head), numpy_top(inner, k), int(tail)
+
+def numpy_top(totals, k):
+    """The `k` largest of `totals`, largest first, after a partial partition
+    rather than a full sort."""
+    import numpy as np
+
+    if len(totals) > k:
+        totals = np.partition(totals, len(totals) - k)[-k:]
+    return sorted(totals.tolist(), reverse=True)
+
+def numpy_top_totals(source, k=3):
+    """top_totals() over NUMPY_BLOCK_BYTES blocks of the (mapped) input, each
+    parsed by numpy_chunk_summary() and stitched by merge_summaries(), so
+    memory stays a small multiple of one block however big the input."""
+    if not isinstance(source, PuzzleInput):
+        source = PuzzleInput.from_text(source)
+    with source.buffer() as data:
+        ranges = chunk_ranges(data, -(-len(data) // NUMPY_BLOCK_BYTES))
+        summaries = [numpy_chunk_summary(data[start:end], k) for start, end in ranges]
+    return merge_summaries(summaries, k)
+
+class NumpyPuzzle(TopTotalsPuzzle):
+    """TopTotalsPuzzle with the parsing done in bulk by numpy, a block of the
+    (mapped) input at a time. numpy is only imported when this engine runs,
+    so the others don't need it installed."""
+
+    def __init__(self,input_text):
+        self.input_text = input_text
+        self.top = numpy_top_totals(input_text, max(self.k, 3))
+
+class IncrementalCalories:
+    """Day 1 state for an input that only ever grows: the `k` largest totals
+    of the elves closed so far, the elf still in progress and how far into the
+    file that got. save() checkpoints it as JSON and load() picks it up again,
+    after which update() reads only what was appended since."""
+
+    # Bytes kept from just before `offset`, re-read on update() as a cheap
+    # check that the file was appended to rather than rewritten.
+    EDGE = 32
+
+    def __init__(self, k=3):
+        self.k = k
+        self.offset = 0
+        self.edge = b""
+        self.pending = b"" # a last line whose newline hasn't arrived yet
+        self.calories = 0
+        self.top = [] # min-heap of at most k closed elves' totals
+
+    def feed(self, data):
+        """Take in the next bytes of the input."""
+        self.offset += len(data)
+        self.edge = (self.edge + data)[-self.EDGE:]
+        data = self.pending + data
+        complete = data.rfind(b"\n") + 1
+        self.pending = data[complete:]
+        for row in data[:complete].split(b"\n")[:-1]:
+            if row.strip():
+                self.calories += int(row)
+                continue
+            if len(self.top) < self.k:
+                heappush(self.top, self.calories)
+            elif self.calories > self.top[0]:
+                heapreplace(self.top, self.calories)
+            self.calories = 0
+
+    def update(self, path):
+        """Feed whatever has been appended to `path` since the last update."""
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < self.offset:
+                raise ValueError(f"{path} is shorter than the checkpoint; it was not appended to")
+            file.seek(self.offset - len(self.edge))
+            if file.read(len(self.edge)) != self.edge:
+                raise ValueError(f"{path} changed before the checkpoint; it was not appended to")
+            while block := file.read(APPEND_BYTES):
+                self.feed(block)
+
+    def top_totals(self):
+        """The `k` largest totals as if the input ended here, with the elf in
+        progress (and a last line still missing its newline) counted."""
+        calories = self.calories + (int(self.pending) if self.pending.strip() else 0)
+        return nlargest(self.k, [*self.top, calories])
+
+    def save(self, path):
+        state = dict(vars(self))
+        # latin-1 maps every byte to one character, so any bytes round-trip.
+        state["edge"] = self.edge.decode("latin-1")
+        state["pending"] = self.pending.decode("latin-1")
+        with open(path, "w") as file:
+            json.dump(state, file)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r") as file:
+            state = json.load(file)
+        incremental = cls(state["k"])
+        vars(incremental).update(state)
+        incremental.edge = state["edge"].encode("latin-1")
+        incremental.pending = state["pending"].encode("latin-1")
+        return incremental
+
+def follow(input_path, checkpoint_path, k=3):
+    """Bring the checkpoint at `checkpoint_path` (started fresh if there isn't
+    one) up to date with the appended-to file at `input_path`, and return the
+    `k` largest totals so far. A checkpoint kept for a different `k` can't
+    answer for this one, so that raises ValueError."""
+    if os.path.exists(checkpoint_path):
+        incremental = IncrementalCalories.load(checkpoint_path)
+        if incremental.k != k:
+            raise ValueError(f"{checkpoint_path} keeps the top {incremental.k} totals, not {k}")
+    else:
+        incremental = IncrementalCalories(k)
+    incremental.update(input_path)
+    incremental.save(checkpoint_path)
+    return incremental.top_totals()
+
+class IncrementalPuzzle(TopTotalsPuzzle):
+    """TopTotalsPuzzle fed to IncrementalCalories the way appends arrive: the
+    input in APPEND_BYTES blocks that may end mid-line."""
+
+    def __init__(self,input_text):
+        self.input_text = input_text
+        incremental = IncrementalCalories(max(self.k, 3))
+        if isinstance(input_text, PuzzleInput) and input_text.path:
+            incremental.update(input_text.path)
         else:
-            print(f"Sample failed; Expected {P1_SAMPLE_SOLUTION}, got {solution_output}")
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if args.inputfile:
-            print("Processing Input...\n")
-            start_time = time()
-            print(f'SOLUTION: {part_one(my_input)}')
-            print(f"Elapsed time {elapsed_time(start_time)}")
+            text = input_text.text() if isinstance(input_text, PuzzleInput) else input_text
+            data = text.encode()
+            for start in range(0, len(data), APPEND_BYTES):
+                incremental.feed(data[start:start + APPEND_BYTES])
+        self.top = incremental.top_totals()
+
+ENGINES = {
+    "topk": TopTotalsPuzzle,
+    "numpy": NumpyPuzzle,
+    "chunked": ChunkedPuzzle,
+    "incremental": IncrementalPuzzle,
+}
+
+def part_one(input_text=SAMPLE_INPUT, jobs=1):
+    # jobs > 1 splits the input between that many worker processes.
+    puzzle = Puzzle(input_text) if jobs == 1 else ChunkedPuzzle(input_text, jobs)
+    puzzle.p1()
+    return puzzle.p1_solution
+
+def part_two(input_text=SAMPLE_INPUT, jobs=1):
+    puzzle = Puzzle(input_text) if jobs == 1 else ChunkedPuzzle(input_text, jobs)
+    puzzle.p2()
+    return puzzle.p2_solution
         
-    if P2_SAMPLE_SOLUTION:
-        print("PART 2\nTesting Sample...\n")
-        start_time = time()
-        solution_output = part_two()
-        if P2_SAMPLE_SOLUTION == solution_output:
-            print("Sample correct.")
-        else:
-            print(f"Sample failed; Expected {P2_SAMPLE_SOLUTION}, got {solution_output}")
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if args.inputfile:
-            print("Processing Input...\n")
-            start_time = time()
-            print(f'SOLUTION: {part_two(my_input)}')
-            print(f"Elapsed time {elapsed_time(start_time)}")
-            
+
+def main():
+    from aoc import runner
+
+    runner.main(["run", str(DAY), *sys.argv[1:]])
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
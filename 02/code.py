@@ -1,56 +1,16 @@
-import argparse
-from time import time
+import os
+import sys
 import json
 import math
+from collections import Counter
 
-DAY = 2
-
-PUZZLE_TEXT = '''
-https://adventofcode.com/2022/day/2
-
---- Day 2: Rock Paper Scissors ---
-
-The Elves begin to set up camp on the beach. To decide whose tent gets to be closest to the snack storage,
- a giant Rock Paper Scissors tournament is already in progress.
-
-Rock Paper Scissors is a game between two players. Each game contains many rounds; in each round, the
-players each simultaneously choose one of Rock, Paper, or Scissors using a hand shape. Then, a winner 
-for that round is selected: Rock defeats Scissors, Scissors defeats Paper, and Paper defeats Rock. If 
-both players choose the same shape, the round instead ends in a draw.
-
-Appreciative of your help yesterday, one Elf gives you an encrypted strategy guide (your puzzle input) 
-that they say will be sure to help you win. "The first column is what your opponent is going to play: A 
-for Rock, B for Paper, and C for Scissors. The second column--" Suddenly, the Elf is called away to help 
-with someone's tent.
-
-The second column, you reason, must be what you should play in response: X for Rock, Y for Paper, and Z 
-for Scissors. Winning every time would be suspicious, so the responses must have been carefully chosen.
-
-The winner of the whole tournament is the player with the highest score. Your total score is the sum of 
-your scores for each round. The score for a single round is the score for the shape you selected (1 for 
-Rock, 2 for Paper, and 3 for Scissors) plus the score for the outcome of the round (0 if you lost, 3 if 
-the round was a draw, and 6 if you won).
-
-Since you can't be sure if the Elf is trying to help you or trick you, you should calculate the score you 
-would get if you were to follow the strategy guide.
-
-For example, suppose you were given the following strategy guide:
-
-A Y
-B X
-C Z
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-This strategy guide predicts and recommends the following:
+from aoc.inputs import PuzzleInput, lines
 
-In the first round, your opponent will choose Rock (A), and you should choose Paper (Y). This ends in a win
-for you with a score of 8 (2 because you chose Paper + 6 because you won).
-In the second round, your opponent will choose Paper (B), and you should choose Rock (X). This ends in a 
-loss for you with a score of 1 (1 + 0).
-The third round is a draw with both players choosing Scissors, giving you a score of 3 + 3 = 6.
-In this example, if you were to follow the strategy guide, you would get a total score of 15 (8 + 1 + 6).
+DAY = 2
 
-What would your total score be if everything goes exactly according to your strategy guide?
-'''
+STREAMING_INPUT = True
 
 SAMPLE_INPUT = '''
 A Y
@@ -62,100 +22,106 @@ P1_SAMPLE_SOLUTION = 15
 
 P2_SAMPLE_SOLUTION = 12
 
-def elapsed_time(start_time):
-    return f"{round(time() - start_time, 8)}s\n"
+# Every possible round's score under both readings of the guide: part 1 takes
+# X/Y/Z as the shape to play, part 2 as the outcome to aim for.
+SCORES = {
+    "A X": (1 + 3, 3 + 0),
+    "A Y": (2 + 6, 1 + 3),
+    "A Z": (3 + 0, 2 + 6),
+    "B X": (1 + 0, 1 + 0),
+    "B Y": (2 + 3, 2 + 3),
+    "B Z": (3 + 6, 3 + 6),
+    "C X": (1 + 6, 2 + 0),
+    "C Y": (2 + 0, 3 + 3),
+    "C Z": (3 + 3, 1 + 6),
+}
+
+class Puzzle():
+    def __init__(self,input_text):
+        self.input_text = input_text
+        self.rounds = list(lines(input_text))
+
+    def p1(self):
+        winning_conditions = [ "A Y", "B Z", "C X"]
+        losing_conditions = [ "A Z", "B X", "C Y"]
+        points = { "X": 1, "Y": 2, "Z": 3 }
+        score = 0
+        for line in self.rounds:
+            if line in winning_conditions:
+                score += 6 + points[line[-1]]
+            elif line in losing_conditions:
+                score += 0 + points[line[-1]]
+            else:
+                score += 3 + points[line[-1]]            
+
+        self.p1_solution = score
+
+    def p2(self):
+        total_score = 0
+        
+        for line in self.rounds:
+            line = line.replace("A","0").replace("B","1").replace("C","2").replace("X","-1").replace("Y","0").replace("Z","1")
+            line = line.split()
+            their_play = int(line[0])
+            result = int(line[-1])
+            my_play = list(range(0,3))[(their_play + result) % 3]
+            points = lambda y : (3*y) + 3
+            total_score += (my_play + 1) + points(result)
+        
+        self.p2_solution = total_score
+
+def count_rounds(source):
+    """{round: count} from Counter over the raw lines, whose counting loop
+    runs in C; line endings and blank lines are only dealt with afterwards,
+    on the few distinct keys."""
+    if isinstance(source, PuzzleInput) and source.path:
+        with open(source.path, "r") as file:
+            counts = Counter(file)
+    else:
+        text = source.text() if isinstance(source, PuzzleInput) else source
+        counts = Counter(text.split("\n"))
+    rounds = Counter()
+    for line, count in counts.items():
+        if line.strip():
+            rounds[line.strip()] += count
+    return rounds
+
+class TablePuzzle(Puzzle):
+    """Same answers as Puzzle with both parts scored at once from SCORES,
+    one lookup per distinct round instead of per-line rules."""
+
+    def __init__(self,input_text):
+        self.input_text = input_text
+        self.rounds = count_rounds(input_text)
+        self.totals = [0, 0]
+        for line, count in self.rounds.items():
+            for strategy, score in enumerate(SCORES[line]):
+                self.totals[strategy] += score * count
+
+    def p1(self):
+        self.p1_solution = self.totals[0]
+
+    def p2(self):
+        self.p2_solution = self.totals[1]
+
+ENGINES = {"table": TablePuzzle}
 
 def part_one(input_text=SAMPLE_INPUT):
-    input_list = input_text.strip().split('\n')
-
-    winning_conditions = [ "A Y", "B Z", "C X"]
-    losing_conditions = [ "A Z", "B X", "C Y"]
-    points = { "X": 1, "Y": 2, "Z": 3 }
-    score = 0
-    for line in input_list:
-        if line in winning_conditions:
-            score += 6 + points[line[-1]]
-        elif line in losing_conditions:
-            score += 0 + points[line[-1]]
-        else:
-            score += 3 + points[line[-1]]            
-
-    return score
+    puzzle = Puzzle(input_text)
+    puzzle.p1()
+    return puzzle.p1_solution
 
 def part_two(input_text=SAMPLE_INPUT):
-    input_text = input_text.replace("A","0").replace("B","1").replace("C","2").replace("X","-1").replace("Y","0").replace("Z","1")
-    input_list = input_text.strip().split('\n')
-    total_score = 0
-    
-    for line in input_list:
-        line = line.split()
-        their_play = int(line[0])
-        result = int(line[-1])
-        my_play = list(range(0,3))[(their_play + result) % 3]
-        points = lambda y : (3*y) + 3
-        total_score += (my_play + 1) + points(result)
-    
-    return total_score
+    puzzle = Puzzle(input_text)
+    puzzle.p2()
+    return puzzle.p2_solution
         
 
 def main():
-    parser = argparse.ArgumentParser(description=f'AOC2022 Puzzle Day { DAY }')
-    parser.add_argument("-p", "--showpuzzle", help="Display Puzzle Text", action='store_true')
-    parser.add_argument("-s", "--showsample", help="Display Sample Input", action='store_true')
-    parser.add_argument("-i", "--inputfile", help="Puzzle Input", type=str)
-    args = parser.parse_args()
-    
-    if args.showpuzzle:
-        print(f"###############\nAOC 2022 DAY {DAY} PUZZLE TEXT\n###############")
-        print(PUZZLE_TEXT)
-    
-    if args.showsample:
-        print(f"###############\nAOC 2022 DAY {DAY} SAMPLE INPUT\n###############")
-        print(SAMPLE_INPUT.lstrip())
-        print(f"\n###############\nAOC 2022 DAY {DAY} P1 SAMPLE SOLUTION\n###############")
-        print(P1_SAMPLE_SOLUTION)
-        print(f"\n###############\nAOC 2022 DAY {DAY} P2 SAMPLE SOLUTION\n###############")
-        print(P2_SAMPLE_SOLUTION)
-    
-    if args.inputfile:        
-        try:
-            my_input = ""
-            with open(args.inputfile, 'r') as file:
-                while (line := file.readline()):
-                    my_input += line            
-        except FileNotFoundError:
-            print("Specified input file not found.")
-            quit()
-
-    if P1_SAMPLE_SOLUTION:            
-        print("PART 1\nTesting Sample...\n")
-        start_time = time()
-        solution_output = part_one()
-        if P1_SAMPLE_SOLUTION == solution_output:
-            print("Sample correct.")
-        else:
-            print(f"Sample failed; Expected {P1_SAMPLE_SOLUTION}, got {solution_output}")
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if args.inputfile:
-            print("Processing Input...\n")
-            start_time = time()
-            print(f'SOLUTION: {part_one(my_input)}')
-            print(f"Elapsed time {elapsed_time(start_time)}")
-        
-    if P2_SAMPLE_SOLUTION:
-        print("PART 2\nTesting Sample...\n")
-        start_time = time()
-        solution_output = part_two()
-        if P2_SAMPLE_SOLUTION == solution_output:
-            print("Sample correct.")
-        else:
-            print(f"Sample failed; Expected {P2_SAMPLE_SOLUTION}, got {solution_output}")
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if args.inputfile:
-            print("Processing Input...\n")
-            start_time = time()
-            print(f'SOLUTION: {part_two(my_input)}')
-            print(f"Elapsed time {elapsed_time(start_time)}")
-    
+    from aoc import runner
+
+    runner.main(["run", str(DAY), *sys.argv[1:]])
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
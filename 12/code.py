@@ -1,40 +1,12 @@
-import argparse
-from time import time
-import numpy
+import os
+import sys
+from collections import deque
 
-DAY = 12
-
-PUZZLE_TEXT = """
---- Day 12: Hill Climbing Algorithm ---
-
-You try contacting the Elves using your handheld device, but the river you're following must be too low to get a decent signal.
-
-You ask the device for a heightmap of the surrounding area (your puzzle input). The heightmap shows the local area from above broken into a grid; the elevation of each square of the grid is given by a single lowercase letter, where a is the lowest elevation, b is the next-lowest, and so on up to the highest elevation, z.
-
-Also included on the heightmap are marks for your current position (S) and the location that should get the best signal (E). Your current position (S) has elevation a, and the location that should get the best signal (E) has elevation z.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-You'd like to reach E, but to save energy, you should do it in as few steps as possible. During each step, you can move exactly one square up, down, left, or right. To avoid needing to get out your climbing gear, the elevation of the destination square can be at most one higher than the elevation of your current square; that is, if your current elevation is m, you could step to elevation n, but not to elevation o. (This also means that the elevation of the destination square can be much lower than the elevation of your current square.)
+from aoc.grid import Grid as FlatGrid
 
-For example:
-
-Sabqponm
-abcryxxl
-accszExk
-acctuvwj
-abdefghi
-Here, you start in the top-left corner; your goal is near the middle. You could start by moving down or right, but eventually you'll need to head toward the e at the bottom. From there, you can spiral around to the goal:
-
-v..v<<<<
->v.vv<<^
-.>vv>E^^
-..v>>>^^
-..>>>>>^
-In the above diagram, the symbols indicate whether the path exits each square moving up (^), down (v), left (<), or right (>). The location that should get the best signal is still E, and . marks unvisited squares.
-
-This path reaches the goal in 31 steps, the fewest possible.
-
-What is the fewest steps required to move from your current position to the location that should get the best signal?
-"""
+DAY = 12
 
 SAMPLE_INPUT = """
 Sabqponm
@@ -44,65 +16,21 @@ acctuvwj
 abdefghi
 """
 
-PUZZLE_INPUT = """
-abccccaaacaccccaaaaacccccccaaccccccccaaaaaaccccccaaaaaccccccccccaaaaaaaaacccccccaaaaaaaaaaaaaaccaaaaaccccccccccccaccacccccccccccccccccccccccccccccccccccccccaaaaaa
-abccaacaaaaaccaaaaacccccaaaaaccccccccaaaaaaccccccaaaaaacccccccccaaaaaaaaaaaaacccaaaaaaaaaaaaaaaaaaaaaccccccccccccaaaacccccccccccccccccccccccccccccccccccccccaaaaaa
-abccaaaaaaaaccaaaaaacccccaaaaaccccccaaaaaaaacccccaaaaaaccccccccccaaaaaaaaaaaacccaaaaaacaaaaaacaaaaaaaaccccccccccaaaaacccccaccccccccccccccccccaaacccccccccccccaaaaa
-abcccaaaaaccccccaaaacccccaaaaacccccaaaaaaaaaaccccaaaaaacccccccccaaaaaaaaaaaaaacaaaaaaaaaaaaaacaaaaaaaaccccccccccaaaaaacccaaacccccccccccccccccaaaccccccccccccccaaaa
-abaaacaaaaacccccacccccccaaaaaccccccaaaaaaaaaaccccccaaaccccccccccaaaaaaaaacaaaaaaaaaaaaaaaaaaacccaaacaccaaaccccccaaaaaaaacaaacccccccccccaaccccaaacccccccccccccccaac
-abaaacaacaaaaccccccccccccccaaccccccacaaaaacccccaacccccccccccccccaaaacaaaaaaaaaacccaacccaaacaacccaaccccaaaaccccccccaacaaaaaaaaaaccccccccaaaaccaaaccccccccccccccaaac
-abaaccaaccaaacacccccccccccccccccccccccaaaacccaaaaaaccaaaccccccccccaacaaaaaaaaaacccaaccccccccccccccccccaaaaccccccccccccaaaaaaaaaccccccciiiiiaaaaacccccccccccccccccc
-abaaccccaaaaaaaacccccccccccccccccccccccaaccccaaaaaaccaaaaaccccacccaaccaaacaaaaacccccccccccccccaacccccccaaaccccccccccccccaaaaacccccccciiiiiiiiaaaaaccccccaaaccccccc
-abaaacccaaaaaaaacccccccccccccccccccccccccccccaaaaaacaaaaaccccaaaaaaaccaaccaaacccccccaaaaacacccaaccccccccccaacccccccccccaaaaaaccccccciiiiiiiiijjaaaaaccccaaacaccccc
-abaaaccccaaaaaaccccccccccccccccccccaaccccccccaaaaaccaaaaacccccaaaaaaaaccccccccccccccaaaaaaaaaaaaccccccccccaaacaaccccccaaaaaaaccccccciiinnnnoijjjjjjjjjjaaaaaaacccc
-abccccccccaaaaacccccaacccccccccccaaaacccccccccaaaacccaaaaaccccaaaaaaaaacccccccccccccaaaaaaaaaaaaaaccccccccaaaaaacccaacaaacaaacccccchhinnnnnoojjjjjjjjjkkaaaaaacccc
-abcccccccaaaaaacaaacaacccccccccccaaaaaaccccccccccccccaacccccccaaaaaaaaacaaccccccccccaaaaaaaaaaaaaaacccccaaaaaaacccaaaaccccccacaaccchhinnnnnoooojjjjjjkkkkaaaaccccc
-abaacccaccaaaccccaaaaaccccccccccccaaaaccccccccccccccccccccccccaaaaaaaacaaaaaaaccccccaaaaaaaaaaaaaaacccccaaaaaaacccaaaaccccaaacaaachhhnnntttuooooooooppkkkaaaaccccc
-abaacccaaaaaaaccccaaaaaacccccccccaaaaaccccccccccccccccccccccccaaaaaaacccaaaaacccccccccaaacaaaaaaaaccccccccaaaaacccaaaacccccaaaaacchhhnnnttttuooooooppppkkkaaaccccc
-abaacccaaaaaaccccaaaaaaacccccccccaacaaccccccccccccccccccccccaaaccaaaccaaaaaaacccccccccccccaaaaaaaccccccaacaacaaacccccccccccaaaaaahhhhnntttttuuouuuuupppkkkcccccccc
-abaaaacaaaaaaaaaaaaaaacccccccccccccccccccccccccccccccccccccaaaacccaaacaaaaaaaaccccccccccccaccaaaccccccaaacaaccccccccccccccaaaaaahhhhnnntttxxxuuuuuuupppkkkcccccccc
-abaaaacaaaaaaaaaaacaaacccaaacccccccccccccccccccccacccccccccaaaacccccccaaaaaaaaccccccccccccccccaaacccccaaacaaacccccccccccccaaaaaahhhhmnnttxxxxuuyuuuuuppkkkcccccccc
-abaaaccaaaaaaaaccccaaaccccaaaccacccccccccccaaaaaaaaccccccccaaaacccccccccaaacaacccccccccccccccccccccaaaaaaaaaacccccacccccccaacaghhhmmmmtttxxxxxxyyyuupppkkccccccccc
-abaaccaaaaaaaccccccccccccaaaaaaaacccccccccccaaaaaaccccccccccccccccccccccaaccccccaacccccccccccccccccaaaaaaaaacccccaaccccccccccagggmmmmttttxxxxxyyyyvvppkkkccccccccc
-abaacccaccaaacccccccccccaaaaaaaaccccccccccccaaaaaaccccccccccccccccccccccccccaaacaaaccccccccccccccccccaaaaaccccaaaaacaacccccccgggmmmmttttxxxxxyyyyvvpppiiiccccccccc
-SbaaaaaccccaaccccccccccaaaaaaaaacacccccccccaaaaaaaacccccccccccccccaacccccccccaaaaaccccccccccaaaacccccaaaaaacccaaaaaaaaccaaaccgggmmmsssxxxEzzzzyyvvvpppiiiccccccccc
-abaaaaaccccccccccccccccaaaaaaaaaaaaaaaaaccaaaaaaaaaacccccccccccaaaaacccccccccaaaaaaaccccccccaaaaaccccaaaaaaaccccaaaaacccaaaaagggmmmsssxxxxxyyyyyyvvqqqiiiccccccccc
-abaaaaacccccccccccccccccaaaaaaaacaaaaaacccaaaaaaaaaaccccccccccccaaaaacccccccaaaaaaaacccccccaaaaaaccccaaacaaacccaaaaacccaaaaaagggmmmssswwwwwyyyyyyyvvqqqiiicccccccc
-abaaaaccccccccccccccccccccaaaaaaaaaaaaacccacacaaacccccccccccccccaaaaacccccccaaaaaaaacccccccaaaaaaccccacccccccccaacaaaccaaaaaagggmmmsssswwwwyyyyyyyvvvqqiiicccccccc
-abaaaaacccccccccccccccccccaacccaaaaaaaaaccccccaaaccccccccccccccaaaaaccccccccaacaaacccccccccaaaaaacccccccccccccccccaaccccaaaaagggmmmmssssswwyywwvvvvvvqqiiicccccccc
-abaaaaaccccccccccccccccccaaacccaaaaaaaaaacccccaaaccccccaacccccccccaaccaaccccccaaaacaccccaacccaacccccccccccccccccccccccccaaaaccggglllllssswwwywwwvvvvqqqiiicccccccc
-abaccccccccccccccccccccccccccccaaaaaaaaaaccccaaaacccaaaacccccccccccccaaaccccccaaaaaaaaaaaacccccccccccccccccccccccccccccccccccccffffllllsswwwwwwrrqvqqqqiiicccccccc
-abccccccccccccccccccccccccccccccccaaacacaccccaaaacccaaaaaacccccccccaaaaaaaaccccaaaaaaaaaaaacccccccccccccccccccccccccccccccccccccfffflllssrwwwwrrrqqqqqqjjicccccccc
-abcccccccaaaccccccccaaccccccccccccaaacccccccccaaaccccaaaaacccccccccaaaaaaaaccaaaaaaacaaaaaaacccccccccccccccccccccccccccccccccccccfffflllrrwwwrrrrqqqqjjjjjcccccccc
-abaaaccaaaaacccccccaaacaaccccccccccaacccccccccccccccaaaaacccccccccccaaaaaacccaaaaaaaaaaaaaaaccccccccccccccccccccccccccccccccccccccffffllrrrrrrrkjjjjjjjjjcccaccccc
-abaaaccaaaaaacccccccaaaaacaacaaccccccccccccccccccccccccaacccccccccccaaaaaacccaaaaaaaaaaaaacccccccccccccccccccccccccccccccccccccccccfffllrrrrrrkkjjjjjjjcccccaccccc
-abaaaccaaaaaacccccaaaaaaccaaaaacccccccccccccccccccccccccccccccccccccaaaaaacccccaaacaaaaaaacccccccccccccccccccccccccccccccccccccccccfffllkkrrrkkkjjddcccccccaaacccc
-abaaaccaaaaaccccccaaaaaaaacaaaaaccccccccccccccccccccccccccccccccccccaaacaacccccaaaccccccaaaaccccaaaccccccccccccccccaaaccccccccccccccfeekkkkkkkkkdddddccccaaaaacccc
-abaaacccaaaaccccccaacaaaaaaaaaaaccccccccccccccccccccccccccccccccccccccaacaacccccccccccccccaaccccaaaacccccccccccccccaaaacccccccccccccceeekkkkkkdddddddcccaaacaccccc
-abaccccccccccccccccccaacccaaaaccccccccccccccccccccccccccccaaccaaccaacccaaaaccccccccccccaaaaaaaacaaaacccccccccccccccaaaacccaaaaacccccceeeekkkkdddddaaccccaacccccccc
-abccccccccccccccccccaaccccccaaccccccccccccaaacccccccccccccaaaaaaccaaaacaaaaacccccccccccaaaaaaaacaaaccccccccccccccccaaaacccaaaaaccccccceeeeeeedddcacacccccccccccccc
-abccccccccccccccccccccccccccccccccccccccccaaaacaacccccccccaaaaacccaaaaaaaaaaccccccccccccaaaaaacccccccccccccccccccccccccccaaaaaacccccccaeeeeeeddcccccccccccccccaaac
-abccccccccccccccccccccccccccccccccccccccccaaaaaaacccccccccaaaaaaccaaaaaaaacaccccccaaacaaaaaaaacccccccccccccccccccccccccccaaaaaacccccccccceeeeaaccccccccccccccccaaa
-abcccccccccccccccccccccccccccccccccccccccccaaaaaaccccccccaaaaaaaaccaaaaaaaccccccccaaaaaaaaaaaacccccccccccccccccccccccccccaaaaaacccccccccccccaaaccccccccccccccccaaa
-abccccccccccccccccccccccccccccccccccccccaaaaaaaaccccaaaccaaaaaaaacaaaaaaaaaacccccccaaaaaaaccaacccccccccccccccccccccccccccccaacccccccccccccccaaaccccccccccccccaaaaa
-abccccccccccccccccccccccccccccccccccccccaaaaaaaaacccaaaaccccaaccaaaaaaaaaaaaaccccaaaaaaaaaacccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccaaaaaa
-"""
-
 P1_SAMPLE_SOLUTION = 31
 
 P2_SAMPLE_SOLUTION = 29
 
-
-def elapsed_time(start_time):
-    return f"{round(time() - start_time, 8)}s\n"
+# Height of every square's byte: S sits at a, E at z.
+ELEVATIONS = bytes.maketrans(b"SEabcdefghijklmnopqrstuvwxyz", bytes([1, 26, *range(1, 27)]))
 
 
+# Only DjikstraInTheHills, the reference search the bfs engine is diffed
+# against, still walks this list-of-lists grid.
 class Grid:
     def __init__(self, gridmap) -> None:
         self.gridmap = gridmap
-        self.gridmap_t = numpy.transpose(self.gridmap).tolist()
         self.height = len(self.gridmap)
-        self.width = len(self.gridmap_t)
+        self.width = len(self.gridmap[0])
         self.every_node = []
         for x in range(0, self.width):
             for y in range(0, self.height):
@@ -130,19 +58,6 @@ class Grid:
 
         return adj
 
-    def adjd(self, coordinate) -> "dict":
-        """returns a dictionary of all valid adjacents including diagonals, and their value."""
-        x, y = coordinate[1], coordinate[0]
-        adjd = dict()
-        adj_x = list(range(max(0, x - 1), min(self.width, x + 2)))
-        adj_y = list(range(max(0, y - 1), min(self.height, y + 2)))
-        for _x in adj_x:
-            for _y in adj_y:
-                if (_x, _y) != (x, y):
-                    adjd[(_x, _y)] = self.gridmap[_y][_x]
-
-        return adjd
-
 
 class DjikstraInTheHills:
     def __init__(self, grid) -> None:
@@ -247,14 +162,15 @@ class Puzzle:
         self.input_text = input_text
         self.input_list = input_text.strip().split("\n")
         self.heightmap = [[*row] for row in self.input_list]
+        # find_path() resets its own search state, so both parts share one grid.
+        self.hills = DjikstraInTheHills(self.heightmap)
 
     def p1(self):
-        find_path = DjikstraInTheHills(self.heightmap)
-        self.p1_solution = find_path.find_path()
+        self.p1_solution = self.hills.find_path()
 
     def p2(self):
         smallest = 9999999
-        find_path = DjikstraInTheHills(self.heightmap)
+        find_path = self.hills
         for node in [
             node
             for node in find_path.grid.every_node
@@ -268,69 +184,56 @@ class Puzzle:
         self.p2_solution = smallest
 
 
-def main():
-    parser = argparse.ArgumentParser(description=f"AOC2022 Puzzle Day { DAY }")
-    parser.add_argument(
-        "-p", "--showpuzzle", help="Display Puzzle Text", action="store_true"
-    )
-    parser.add_argument(
-        "-s", "--showsample", help="Display Sample Input", action="store_true"
-    )
-    args = parser.parse_args()
-
-    if args.showpuzzle:
-        print(f"###############\nAOC 2022 DAY {DAY} PUZZLE TEXT\n###############")
-        print(PUZZLE_TEXT)
-
-    if args.showsample:
-        print(f"###############\nAOC 2022 DAY {DAY} SAMPLE INPUT\n###############")
-        print(SAMPLE_INPUT.strip())
-        print(
-            f"\n###############\nAOC 2022 DAY {DAY} P1 SAMPLE SOLUTION\n###############"
-        )
-        print(P1_SAMPLE_SOLUTION)
-        print(
-            f"\n###############\nAOC 2022 DAY {DAY} P2 SAMPLE SOLUTION\n###############"
+class ReverseBfsPuzzle(Puzzle):
+    """Same answers as Puzzle from one breadth-first search backwards from E,
+    which gives every square's distance to E at once: part 1 reads off S and
+    part 2 takes the best 'a', instead of a Dijkstra per start square."""
+
+    def __init__(self, input_text):
+        self.input_list = input_text.strip().split("\n")
+        self.grid = FlatGrid.from_rows(self.input_list)
+        self.distances = self.distances_to_summit()
+
+    def distances_to_summit(self):
+        elevations = self.grid.translate(ELEVATIONS)
+        (summit,) = self.grid.find(b"E")
+        distances = [None] * len(elevations.cells)
+        distances[summit] = 0
+        frontier = deque([summit])
+        while frontier:
+            square = frontier.popleft()
+            # Walking backwards: a neighbour can step here if this square is
+            # at most one higher than it.
+            lowest = elevations[square] - 1
+            for neighbour in elevations.neighbours(square):
+                if distances[neighbour] is None and elevations[neighbour] >= lowest:
+                    distances[neighbour] = distances[square] + 1
+                    frontier.append(neighbour)
+        return distances
+
+    def p1(self):
+        (start,) = self.grid.find(b"S")
+        distance = self.distances[start]
+        self.p1_solution = False if distance is None else distance
+
+    def p2(self):
+        self.p2_solution = min(
+            [
+                self.distances[start]
+                for start in self.grid.find(b"Sa")
+                if self.distances[start] is not None
+            ],
+            default=9999999,
         )
-        print(P2_SAMPLE_SOLUTION)
-
-    if P1_SAMPLE_SOLUTION:
-        print("PART 1\nTesting Sample...\n")
-        start_time = time()
-        sample = Puzzle(input_text=SAMPLE_INPUT)
-        sample.p1()
-        if P1_SAMPLE_SOLUTION == sample.p1_solution:
-            print("Sample correct.")
-        else:
-            print(
-                f"Sample failed; Expected {P1_SAMPLE_SOLUTION}, got {sample.p1_solution}"
-            )
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if PUZZLE_INPUT:
-            puzzle = Puzzle(input_text=PUZZLE_INPUT)
-            puzzle.p1()
-            print("Processing Input...\n")
-            start_time = time()
-            print(f"SOLUTION: {puzzle.p1_solution}")
-            print(f"Elapsed time {elapsed_time(start_time)}")
-
-    if P2_SAMPLE_SOLUTION:
-        print("PART 2\nTesting Sample...\n")
-        start_time = time()
-        sample.p2()
-        if P2_SAMPLE_SOLUTION == sample.p2_solution:
-            print("Sample correct.")
-        else:
-            print(
-                f"Sample failed; Expected {P2_SAMPLE_SOLUTION}, got {sample.p2_solution}"
-            )
-        print(f"Elapsed time {elapsed_time(start_time)}")
-        if PUZZLE_INPUT:
-            print("Processing Input...\n")
-            start_time = time()
-            puzzle.p2()
-            print(f"SOLUTION: {puzzle.p2_solution}")
-            print(f"Elapsed time {elapsed_time(start_time)}")
+
+
+ENGINES = {"bfs": ReverseBfsPuzzle}
+
+
+def main():
+    from aoc import runner
+
+    runner.main(["run", str(DAY), *sys.argv[1:]])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+"""Shared tooling for running the NN/code.py day scripts.
+
+    python -m aoc run            # every day, sample check + puzzle input
+    python -m aoc run 9 11 -P 2  # selected days / parts
+"""
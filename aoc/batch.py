@@ -0,0 +1,265 @@
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+
+from aoc.days import PARTS, Day, quiet
+from aoc.inputs import PuzzleInput
+from aoc.runner import (
+    add_cache_arguments,
+    cache_from_args,
+    phase_name,
+    select_parts,
+    solve_cached,
+)
+
+PREFETCH_BYTES = 1024 * 1024
+
+
+def batch_inputs(target):
+    """Input files named by `target`: every file in a directory, or the paths
+    listed one per line in a manifest file (relative to the manifest; blank
+    lines and # comments are skipped)."""
+    if os.path.isdir(target):
+        names = sorted(os.listdir(target))
+        return [
+            os.path.join(target, name)
+            for name in names
+            if os.path.isfile(os.path.join(target, name))
+        ]
+    base = os.path.dirname(os.path.abspath(target))
+    with open(target, "r") as manifest:
+        entries = [line.strip() for line in manifest]
+    return [
+        os.path.join(base, entry) for entry in entries if entry and not entry.startswith("#")
+    ]
+
+
+def read_text(path, streaming=False):
+    """(text, seconds) for one input file; runs on an ingestion thread.
+
+    Returns None for inputs the worker should open itself instead: every
+    input of a day that streams its input (it reads them in constant memory,
+    which a prefetched str would throw away) and any over PREFETCH_BYTES, so
+    read-ahead only ever holds small files."""
+    if streaming or os.path.getsize(path) > PREFETCH_BYTES:
+        return None
+    start_time = perf_counter()
+    with open(path, "r") as file:
+        text = file.read()
+    return text, perf_counter() - start_time
+
+
+def solve_file(day, index, path, parts=None, cache=None, prefetched=None):
+    """Solve one input file in a worker; always returns a record, never raises.
+
+    `prefetched`, the (text, seconds) the ingestion stage already read, saves
+    the worker reading `path` itself; None leaves it to the worker."""
+    record = {"day": day, "index": index, "input": path}
+    start_time = perf_counter()
+    try:
+        puzzle_day = Day(day)
+        parts = select_parts(puzzle_day, parts)
+        if prefetched is None:
+            input_start = perf_counter()
+            input_text = puzzle_day.prepare(PuzzleInput.from_file(path))
+            load_seconds = perf_counter() - input_start
+        else:
+            text, load_seconds = prefetched
+            input_text = puzzle_day.prepare(PuzzleInput.from_text(text))
+        with quiet():
+            if cache is None:
+                answers, timings = puzzle_day.solve(input_text, parts)
+                cached = set()
+            else:
+                answers, timings, cached = solve_cached(puzzle_day, input_text, parts, cache)
+        record["answers"] = {str(part): answers[part] for part in parts}
+        record["timings"] = {"load": load_seconds}
+        record["timings"].update(
+            {phase_name(phase): seconds for phase, seconds in timings.items()}
+        )
+        if cached:
+            record["cached"] = sorted(cached)
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = perf_counter() - start_time
+    return record
+
+
+def failed_record(day, index, path, error):
+    return {"day": day, "index": index, "input": path, "error": f"{type(error).__name__}: {error}"}
+
+
+class Workers:
+    """The batch's process pool. A worker that dies (OOM-killed, segfault)
+    breaks the whole pool, so replace() swaps in a fresh one for the inputs
+    still to come."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.pool = ProcessPoolExecutor(max_workers=jobs)
+
+    def replace(self, broken):
+        # Every input in flight sees the same breakage; only the first
+        # replaces the pool.
+        if self.pool is broken:
+            self.pool = ProcessPoolExecutor(max_workers=self.jobs)
+            broken.shutdown(wait=False)
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+
+async def ingest(day, paths, inputs, records, readers, streaming=False):
+    """Read and decode `paths` on `readers` threads into the bounded `inputs`
+    queue; when it's full the readers wait, so prefetching never runs more
+    than the queue's size ahead of the solvers."""
+    pending = list(enumerate(paths))
+    pending.reverse()
+
+    async def reader():
+        while pending:
+            index, path = pending.pop()
+            try:
+                prefetched = await asyncio.to_thread(read_text, path, streaming)
+            except (OSError, UnicodeDecodeError) as error:
+                await records.put(failed_record(day, index, path, error))
+                continue
+            await inputs.put((index, path, prefetched))
+
+    await asyncio.gather(*(reader() for _ in range(readers)))
+
+
+async def solve_inputs(day, inputs, records, workers, parts=None, cache=None):
+    """Hand each prefetched input to the process pool, keeping at most two per
+    worker in flight, and put the finished records on `records`."""
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(2 * workers.jobs)
+
+    async def solve(index, path, prefetched):
+        arguments = (solve_file, day, index, path, parts, cache, prefetched)
+        pool = workers.pool
+        try:
+            record = await loop.run_in_executor(pool, *arguments)
+        except BrokenProcessPool:
+            # Some worker died, not necessarily on this input. Retry it on a
+            # pool of its own, so the input that kills its worker fails alone
+            # instead of taking the rest of the batch with it.
+            workers.replace(pool)
+            alone = ProcessPoolExecutor(max_workers=1)
+            try:
+                record = await loop.run_in_executor(alone, *arguments)
+            except Exception as error:
+                # The worker itself died (e.g. killed); the solver never reported.
+                record = failed_record(day, index, path, error)
+            finally:
+                alone.shutdown(wait=False)
+        except Exception as error:
+            record = failed_record(day, index, path, error)
+        finally:
+            slots.release()
+        await records.put(record)
+
+    tasks = []
+    while (item := await inputs.get()) is not None:
+        await slots.acquire()
+        tasks.append(asyncio.create_task(solve(*item)))
+    await asyncio.gather(*tasks)
+
+
+async def run_batch(day, paths, emit, parts=None, jobs=None, cache=None, prefetch=None, readers=4):
+    """Solve every input path, calling `emit(record)` (on a thread, so slow
+    output doesn't stall the pipeline) for each in the order they finish.
+
+    Reading, solving and writing run as three stages joined by queues of at
+    most `prefetch` items (default: two per worker), so file I/O on either
+    side overlaps the CPU-bound solving in the process pool."""
+    jobs = jobs or os.cpu_count() or 1
+    prefetch = prefetch or 2 * jobs
+    try:
+        streaming = Day(day).streaming
+    except Exception:
+        # Every input's record will say why the day doesn't load.
+        streaming = False
+    inputs = asyncio.Queue(maxsize=prefetch)
+    records = asyncio.Queue(maxsize=prefetch)
+
+    async def produce():
+        workers = Workers(jobs)
+        try:
+            solving = asyncio.create_task(
+                solve_inputs(day, inputs, records, workers, parts, cache)
+            )
+            await ingest(day, paths, inputs, records, readers, streaming)
+            await inputs.put(None)
+            await solving
+        finally:
+            workers.shutdown()
+        await records.put(None)
+
+    producing = asyncio.create_task(produce())
+    while (record := await records.get()) is not None:
+        await asyncio.to_thread(emit, record)
+    await producing
+
+
+def command_batch(args):
+    if (args.prefetch is not None and args.prefetch < 1) or args.readers < 1:
+        sys.exit("--prefetch and --readers must be at least 1")
+    paths = batch_inputs(args.inputs)
+    output = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+
+    def emit(record):
+        nonlocal failures
+        failures += "error" in record
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+
+    try:
+        asyncio.run(
+            run_batch(
+                args.day,
+                paths,
+                emit,
+                args.parts,
+                args.jobs,
+                cache_from_args(args),
+                args.prefetch,
+                args.readers,
+            )
+        )
+    finally:
+        if args.output:
+            output.close()
+    print(f"{len(paths)} inputs, {failures} failed", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def add_parser(commands):
+    batch = commands.add_parser(
+        "batch", help="Solve many input files for one day, streaming JSON lines"
+    )
+    batch.add_argument("day", type=int, help="Day to solve")
+    batch.add_argument("inputs", help="Directory of input files, or a manifest file")
+    batch.add_argument(
+        "-P", "--part", dest="parts", type=int, choices=PARTS, action="append",
+        help="Only run this part (repeatable)",
+    )
+    batch.add_argument(
+        "-j", "--jobs", help="Worker processes (default: one per CPU)", type=int
+    )
+    batch.add_argument(
+        "--prefetch", type=int,
+        help="Inputs read ahead of, and results queued behind, the solvers (default: 2 per job;"
+        " streaming days' inputs and any over 1 MiB are left for the workers to read)",
+    )
+    batch.add_argument(
+        "--readers", type=int, default=4, help="Threads reading input files concurrently"
+    )
+    batch.add_argument("-o", "--output", help="Write JSON lines here instead of stdout")
+    add_cache_arguments(batch)
+    batch.set_defaults(func=command_batch)
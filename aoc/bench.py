@@ -0,0 +1,152 @@
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from aoc.days import ROOT, Day, quiet
+from aoc.limits import add_limit_arguments, limits_from_args, run_limited
+from aoc.runner import (
+    add_day_arguments,
+    error_row,
+    failed,
+    phase_name,
+    select_parts,
+    selected_days,
+    workloads,
+)
+
+
+def percentile(samples, fraction):
+    # Nearest-rank, so the value reported is always one that was measured.
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(samples):
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "mean": statistics.fmean(samples),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def bench_day(
+    day, parts=None, inputfile=None, sample=True, repeats=10, warmup=2, engine=None
+):
+    """Time every phase repeatedly on a fresh solver each run.
+
+    Timings come from Day.solve (time.perf_counter, monotonic); the first
+    `warmup` runs are discarded. Solver progress output is swallowed so it
+    doesn't flood the report."""
+    rows = []
+    try:
+        puzzle_day = Day(day)
+        parts = select_parts(puzzle_day, parts)
+        for kind, input_text, group, _ in workloads(puzzle_day, parts, inputfile, sample):
+            samples = {}
+            with quiet():
+                for run in range(warmup + repeats):
+                    answers, timings = puzzle_day.solve(input_text, group, engine=engine)
+                    if run >= warmup:
+                        for phase, seconds in timings.items():
+                            samples.setdefault(phase, []).append(seconds)
+            for phase, phase_samples in samples.items():
+                row = {"day": day, "kind": kind, "phase": phase_name(phase), "group": group}
+                if phase in answers:
+                    row["part"] = phase
+                    row["answer"] = answers[phase]
+                    if kind == "sample":
+                        row["correct"] = answers[phase] == puzzle_day.sample_solution(phase)
+                row.update(summarize(phase_samples))
+                rows.append(row)
+    except Exception as error:
+        rows.append(error_row(day, error))
+    return rows
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(repeats, warmup):
+    return {
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "warmup": warmup,
+    }
+
+
+def print_bench(rows):
+    print(
+        f"{'DAY':>3}  {'PHASE':<6}  {'INPUT':<6}  {'RUNS':>4}  "
+        f"{'MIN':>11}  {'MEDIAN':>11}  {'P95':>11}  {'STDDEV':>11}"
+    )
+    for row in rows:
+        if row["kind"] == "error":
+            print(f"{row['day']:>3}  {'':<6}  {'error':<6}  {row['error']}")
+            continue
+        flag = "" if row.get("correct", True) else "  WRONG ANSWER"
+        print(
+            f"{row['day']:>3}  {row['phase']:<6}  {row['kind']:<6}  {row['runs']:>4}  "
+            f"{row['min']:>10.6f}s  {row['median']:>10.6f}s  {row['p95']:>10.6f}s  "
+            f"{row['stddev']:>10.6f}s{flag}"
+        )
+
+
+def command_bench(args):
+    if args.repeats < 1 or args.warmup < 0:
+        sys.exit("--repeats must be at least 1 and --warmup not negative")
+    days = selected_days(args)
+    timeout, memory_limit = limits_from_args(args)
+    tasks = [
+        (
+            day,
+            bench_day,
+            (
+                day,
+                args.parts,
+                args.inputfile,
+                not args.nosample,
+                args.repeats,
+                args.warmup,
+                args.engine,
+            ),
+        )
+        for day in days
+    ]
+    if timeout or memory_limit:
+        # The limits cover a day's whole benchmark, warmup runs included.
+        rows = run_limited(tasks, timeout, memory_limit)
+    else:
+        rows = [row for _, function, arguments in tasks for row in function(*arguments)]
+    print_bench(rows)
+    if args.json:
+        report = {"meta": metadata(args.repeats, args.warmup), "results": rows}
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+    return 1 if failed(rows) else 0
+
+
+def add_parser(commands):
+    bench = commands.add_parser("bench", help="Repeated timing with summary statistics")
+    add_day_arguments(bench)
+    bench.add_argument("-r", "--repeats", help="Timed runs per part", type=int, default=10)
+    bench.add_argument("-w", "--warmup", help="Untimed runs first", type=int, default=2)
+    bench.add_argument("--json", help="Write results to this JSON file for archiving")
+    add_limit_arguments(bench)
+    bench.set_defaults(func=command_bench)
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import sqlite3
+from time import time
+
+from aoc.days import ROOT
+from aoc.inputs import PuzzleInput
+
+DEFAULT_PATH = os.path.join(ROOT, ".aoc-cache", "results.sqlite3")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def input_digest(source):
+    if isinstance(source, PuzzleInput):
+        return source.digest()
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+class ResultCache:
+    """Answers and timings on disk, keyed by (day, part, sha256 of the input,
+    sha256 of that day's code.py).
+
+    Editing NN/code.py changes its digest, so only that day's entries stop
+    matching; they are never looked up again and age out. Once the stored
+    entries pass `max_bytes`, the least recently used ones are dropped."""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._connection = None
+
+    def __getstate__(self):
+        # Worker processes get the settings and open their own connection.
+        return {"path": self.path, "max_bytes": self.max_bytes, "_connection": None}
+
+    @property
+    def db(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " day INTEGER, part INTEGER, input TEXT, source TEXT,"
+                " answer TEXT, seconds REAL, size INTEGER, last_used REAL,"
+                " PRIMARY KEY (day, part, input, source))"
+            )
+        return self._connection
+
+    def get(self, day, part, input_hash, source_hash):
+        """Return (answer, seconds) or None, marking a hit as recently used."""
+        key = (day, part, input_hash, source_hash)
+        row = self.db.execute(
+            "SELECT answer, seconds FROM results"
+            " WHERE day = ? AND part = ? AND input = ? AND source = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        self.db.execute(
+            "UPDATE results SET last_used = ?"
+            " WHERE day = ? AND part = ? AND input = ? AND source = ?",
+            (time(), *key),
+        )
+        return json.loads(row[0]), row[1]
+
+    def put(self, day, part, input_hash, source_hash, answer, seconds):
+        answer = json.dumps(answer)
+        size = len(answer) + len(input_hash) + len(source_hash) + 32
+        self.db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (day, part, input_hash, source_hash, answer, seconds, size, time()),
+        )
+        self.evict()
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        oldest = self.db.execute("SELECT rowid, size FROM results ORDER BY last_used")
+        doomed = []
+        for rowid, size in oldest:
+            if total <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            total -= size
+        self.db.executemany("DELETE FROM results WHERE rowid = ?", doomed)
+
+    def clear(self):
+        self.db.execute("DELETE FROM results")
@@ -0,0 +1,203 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import types
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from time import perf_counter
+
+from aoc.inputs import PuzzleInput
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = (1, 2)
+
+_modules = {}
+
+
+def day_path(day, filename="code.py"):
+    return os.path.join(ROOT, f"{day:02}", filename)
+
+
+def available_days():
+    # Day 0 is the template every other day is copied from, so it is never run.
+    return [day for day in range(1, 26) if os.path.exists(day_path(day))]
+
+
+def load_day(day):
+    """Import NN/code.py once per process; the day folders are not packages."""
+    if day not in _modules:
+        spec = importlib.util.spec_from_file_location(f"day{day:02}", day_path(day))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[day] = module
+    return _modules[day]
+
+
+def shared_sources(module):
+    """Files of the aoc modules `module` refers to from its globals (such as
+    aoc.inputs for lines() or aoc.grid for Grid), and the ones those refer
+    to in turn. Imports inside functions, like the runner in each day's
+    main(), don't count: they aren't part of solving."""
+    found = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            if isinstance(value, types.ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or name in found or name.split(".")[0] != "aoc":
+                continue
+            found[name] = sys.modules[name]
+            pending.append(found[name])
+    return sorted(shared.__file__ for shared in found.values())
+
+
+def call_day(day, name, *args):
+    """Call function `name` from NN/code.py. Day modules aren't importable by
+    name, so their functions can't be pickled for a process pool; submitting
+    this with the day number instead lets the worker load the day itself."""
+    return getattr(load_day(day), name)(*args)
+
+
+@contextmanager
+def quiet():
+    """Swallow solver progress output (days 11 and 12 print while they work)."""
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        yield
+
+
+def plain(answer):
+    # numpy scalars (from any vectorised engine) don't survive json or pickling
+    # into other interpreters cleanly.
+    if hasattr(answer, "item"):
+        return answer.item()
+    return answer
+
+
+class Day:
+    """Uniform view over both day conventions: part_one()/part_two() functions
+    (days 01-06) and a Puzzle class with p1()/p2() setting pN_solution.
+
+    Puzzle days may also list alternative implementations in ENGINES, a dict
+    of name -> Puzzle-like class; Puzzle itself is the "reference" engine."""
+
+    def __init__(self, day):
+        self.day = day
+        self.module = load_day(day)
+
+    def source_digest(self):
+        """sha256 over NN/code.py and the shared aoc modules it solves with,
+        so editing either one changes it."""
+        if not hasattr(self, "_source_digest"):
+            digest = hashlib.sha256()
+            for path in [day_path(self.day), *shared_sources(self.module)]:
+                digest.update(os.path.relpath(path, ROOT).encode() + b"\0")
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+            self._source_digest = digest.hexdigest()
+        return self._source_digest
+
+    @property
+    def parts(self):
+        return [part for part in PARTS if self.sample_solution(part)]
+
+    def sample_solution(self, part):
+        return getattr(self.module, f"P{part}_SAMPLE_SOLUTION", False)
+
+    def sample_name(self, part):
+        """Which constant holds `part`'s sample: a few days have their own
+        P2_SAMPLE_INPUT."""
+        if part == 2 and getattr(self.module, "P2_SAMPLE_INPUT", False):
+            return "P2_SAMPLE_INPUT"
+        return "SAMPLE_INPUT"
+
+    def sample_input(self, part):
+        return getattr(self.module, self.sample_name(part))
+
+    def read(self, filename):
+        # The prose and the real input live next to code.py rather than in it,
+        # so importing a day costs nothing until one of them is asked for.
+        try:
+            with open(day_path(self.day, filename), "r") as file:
+                return file.read()
+        except FileNotFoundError:
+            return ""
+
+    def puzzle_text(self):
+        return self.read("puzzle.txt")
+
+    def puzzle_input(self):
+        path = day_path(self.day, "input.txt")
+        if os.path.exists(path) and os.path.getsize(path):
+            return PuzzleInput.from_file(path)
+        return False
+
+    @property
+    def engines(self):
+        if not hasattr(self.module, "Puzzle"):
+            return []
+        return ["reference", *getattr(self.module, "ENGINES", {})]
+
+    def puzzle_class(self, engine=None):
+        if engine in (None, "reference") and hasattr(self.module, "Puzzle"):
+            return self.module.Puzzle
+        engines = getattr(self.module, "ENGINES", {})
+        if engine not in engines:
+            available = ", ".join(self.engines) or "none"
+            raise ValueError(f"Day {self.day} has no engine {engine!r} (available: {available})")
+        return engines[engine]
+
+    @property
+    def streaming(self):
+        return getattr(self.module, "STREAMING_INPUT", False)
+
+    @property
+    def chained(self):
+        return getattr(self.module, "CHAINED_PARTS", False)
+
+    def prepare(self, source):
+        """Turn a PuzzleInput into what this day's solver takes: the input
+        itself for days that stream it (STREAMING_INPUT), else its full text."""
+        if isinstance(source, PuzzleInput) and not self.streaming:
+            return source.text()
+        return source
+
+    def solve(self, input_text, parts, wrap=None, engine=None):
+        """Solve the requested parts of one input.
+
+        Returns ({part: answer}, {phase: seconds}). Phases are "parse" (building
+        the Puzzle, for days that have one) and each requested part number.
+        `wrap(phase)`, if given, returns a context manager entered around each
+        of those phases (e.g. to profile them). `engine` picks one of ENGINES
+        in place of Puzzle."""
+        wrap = wrap or (lambda phase: nullcontext())
+        answers, timings = {}, {}
+        if hasattr(self.module, "Puzzle") or engine:
+            puzzle_class = self.puzzle_class(engine)
+            with wrap("parse"):
+                start_time = perf_counter()
+                puzzle = puzzle_class(input_text=input_text)
+                timings["parse"] = perf_counter() - start_time
+            # A day whose later parts use state left by earlier ones (day 10's
+            # CRT) sets CHAINED_PARTS; then every part up to the last requested
+            # one runs, in order, on the same instance, the unrequested ones
+            # untimed. Otherwise only the requested parts run.
+            run = range(1, max(parts) + 1) if self.chained else sorted(parts)
+            for part in run:
+                with wrap(part) if part in parts else nullcontext():
+                    start_time = perf_counter()
+                    getattr(puzzle, f"p{part}")()
+                    seconds = perf_counter() - start_time
+                if part in parts:
+                    answers[part] = plain(getattr(puzzle, f"p{part}_solution"))
+                    timings[part] = seconds
+        else:
+            functions = {1: self.module.part_one, 2: self.module.part_two}
+            for part in parts:
+                with wrap(part):
+                    start_time = perf_counter()
+                    answers[part] = plain(functions[part](input_text))
+                    timings[part] = perf_counter() - start_time
+        return answers, timings
@@ -0,0 +1,162 @@
+import random
+import sys
+
+from aoc.days import Day, available_days, quiet
+from aoc.generators import GENERATORS, generate
+
+# Generator sizes to draw trial inputs from, per day. The reference solvers
+# are the slow ones being checked against, so these stay small; day 12's
+# reference runs a full Dijkstra per 'a' square.
+TRIAL_SIZES = {12: (14, 18)}
+DEFAULT_TRIAL_SIZES = (1, 60)
+
+
+def outcome(puzzle_day, text, parts, engine):
+    """(answers or error string, seconds) for one engine on one input."""
+    try:
+        with quiet():
+            answers, timings = puzzle_day.solve(text, parts, engine=engine)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}", 0.0
+    return answers, sum(timings.values())
+
+
+def disagrees(puzzle_day, lines, parts, engine):
+    """True when `engine` and the reference differ on these lines; inputs the
+    reference itself can't solve don't count."""
+    text = "\n".join(lines) + "\n"
+    expected, _ = outcome(puzzle_day, text, parts, "reference")
+    if isinstance(expected, str):
+        return False
+    return outcome(puzzle_day, text, parts, engine)[0] != expected
+
+
+def minimize(still_fails, lines):
+    """Drop chunks of lines, halving the chunk size each pass, for as long as
+    `still_fails(lines)` holds; returns the smallest failing input found."""
+    chunk = len(lines) // 2
+    while chunk >= 1:
+        start = 0
+        while start < len(lines):
+            candidate = lines[:start] + lines[start + chunk :]
+            if candidate and still_fails(candidate):
+                lines = candidate
+            else:
+                start += chunk
+        chunk //= 2
+    return lines
+
+
+def check_engine(puzzle_day, engine, trials, seed=0):
+    """Cross-check `engine` against the reference on `trials` generated inputs.
+
+    Returns a summary with both engines' total solve time and, for the first
+    disagreement, the input cut down to a minimal reproducer."""
+    day = puzzle_day.day
+    parts = puzzle_day.parts
+    low, high = TRIAL_SIZES.get(day, DEFAULT_TRIAL_SIZES)
+    rng = random.Random(f"{day}:{engine}:{seed}")
+    result = {
+        "day": day,
+        "engine": engine,
+        "trials": 0,
+        "mismatches": 0,
+        "reference_seconds": 0.0,
+        "engine_seconds": 0.0,
+    }
+    for trial in range(trials):
+        size = rng.randint(low, high)
+        lines = list(generate(day, size, seed=f"{seed}:{trial}"))
+        text = "\n".join(lines) + "\n"
+        expected, reference_seconds = outcome(puzzle_day, text, parts, "reference")
+        if isinstance(expected, str):
+            continue  # The generator made something the reference can't take.
+        answers, engine_seconds = outcome(puzzle_day, text, parts, engine)
+        if isinstance(answers, str) and answers.startswith("ModuleNotFoundError"):
+            # An engine built on an optional dependency that isn't installed.
+            result["skipped"] = answers
+            break
+        result["trials"] += 1
+        result["reference_seconds"] += reference_seconds
+        result["engine_seconds"] += engine_seconds
+        if answers == expected:
+            continue
+        result["mismatches"] += 1
+        if "reproducer" not in result:
+            smallest = minimize(
+                lambda candidate: disagrees(puzzle_day, candidate, parts, engine), lines
+            )
+            text = "\n".join(smallest) + "\n"
+            result["reproducer"] = {
+                "size": size,
+                "seed": f"{seed}:{trial}",
+                "input": text,
+                "reference": outcome(puzzle_day, text, parts, "reference")[0],
+                engine: outcome(puzzle_day, text, parts, engine)[0],
+            }
+    if result["engine_seconds"]:
+        result["speedup"] = result["reference_seconds"] / result["engine_seconds"]
+    return result
+
+
+def print_result(result):
+    if "skipped" in result:
+        print(f"{result['day']:>3}  {result['engine']:<10}  skipped: {result['skipped']}")
+        return
+    speedup = f"{result['speedup']:.1f}x" if "speedup" in result else "-"
+    print(
+        f"{result['day']:>3}  {result['engine']:<10}  {result['trials']:>6}  "
+        f"{result['mismatches']:>10}  {result['reference_seconds']:>10.3f}s  "
+        f"{result['engine_seconds']:>10.3f}s  {speedup:>8}"
+    )
+
+
+def print_reproducer(result):
+    reproducer = result["reproducer"]
+    print(
+        f"\nDay {result['day']} engine {result['engine']!r} disagrees "
+        f"(generator size {reproducer['size']}, seed {reproducer['seed']!r}); minimized input:"
+    )
+    print(reproducer["input"], end="")
+    print(f"reference: {reproducer['reference']!r}")
+    print(f"{result['engine']}: {reproducer[result['engine']]!r}")
+
+
+def command_diff(args):
+    if args.trials < 1:
+        sys.exit("--trials must be at least 1")
+    checks = []
+    for day in args.days or available_days():
+        if day not in GENERATORS:
+            continue
+        puzzle_day = Day(day)
+        engines = [engine for engine in puzzle_day.engines if engine != "reference"]
+        checks.extend(
+            (puzzle_day, engine) for engine in engines if not args.engine or engine == args.engine
+        )
+    if not checks:
+        sys.exit("No engines to check")
+    print(
+        f"{'DAY':>3}  {'ENGINE':<10}  {'TRIALS':>6}  {'MISMATCHES':>10}  "
+        f"{'REFERENCE':>11}  {'ENGINE':>11}  {'SPEEDUP':>8}"
+    )
+    results = []
+    for puzzle_day, engine in checks:
+        result = check_engine(puzzle_day, engine, args.trials, args.seed)
+        print_result(result)
+        results.append(result)
+    for result in results:
+        if "reproducer" in result:
+            print_reproducer(result)
+    return 1 if any(result["mismatches"] for result in results) else 0
+
+
+def add_parser(commands):
+    diff = commands.add_parser(
+        "diff", help="Cross-check each day's engines against its reference Puzzle"
+    )
+    diff.add_argument("days", nargs="*", type=int, help="Days to check (default: all)")
+    diff.add_argument("-e", "--engine", help="Only check this engine")
+    diff.add_argument("-n", "--trials", type=int, default=1000, help="Inputs per engine")
+    diff.add_argument("--seed", type=int, default=0)
+    diff.set_defaults(func=command_diff)
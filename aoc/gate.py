@@ -0,0 +1,204 @@
+import json
+import os
+import platform
+import sys
+
+from aoc.bench import bench_day, metadata
+from aoc.days import PARTS, ROOT, Day, available_days, quiet
+from aoc.memory import MemoryTracker
+from aoc.runner import error_row, select_parts, workloads
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Changes smaller than these are noise whatever the percentage says; a few
+# milliseconds is what a busy machine adds to one phase run to run.
+MIN_SECONDS = 0.005
+MIN_BYTES = 64 * 1024
+
+
+def traced_peaks(day, parts=None, inputfile=None):
+    """{row_key: tracemalloc peak bytes} from one traced solve of
+    each input; kept apart from the timed runs, which tracing slows down."""
+    puzzle_day = Day(day)
+    parts = select_parts(puzzle_day, parts)
+    peaks = {}
+    with quiet():
+        for kind, input_text, group, _ in workloads(puzzle_day, parts, inputfile):
+            tracker = MemoryTracker(top=0)
+            puzzle_day.solve(input_text, group, tracker.wrap(day, kind, group))
+            for (_, _, _, phase), record in tracker.records.items():
+                row = {"day": day, "kind": kind, "group": group, "phase": phase}
+                peaks[row_key(row)] = record["traced_peak"]
+    return peaks
+
+
+def measure_day(day, parts=None, inputfile=None, repeats=5, warmup=1):
+    """bench_day rows (sample and input) with each phase's traced peak added."""
+    rows = bench_day(day, parts, inputfile, True, repeats, warmup)
+    if any(row["kind"] == "error" for row in rows):
+        return rows
+    try:
+        peaks = traced_peaks(day, parts, inputfile)
+    except Exception as error:
+        return rows + [error_row(day, error)]
+    for row in rows:
+        row["traced_peak"] = peaks.get(row_key(row))
+    return rows
+
+
+def row_key(row):
+    # Day 9's parts have different samples, so "sample parse" alone is
+    # ambiguous; samples are told apart by which one was read rather than by
+    # the parts asked for, so a -P run still lines up with a full baseline.
+    sample = ""
+    if row["kind"] == "sample":
+        sample = Day(row["day"]).sample_name(row["group"][0])
+    return (row["day"], row["kind"], sample, row["phase"])
+
+
+def regressions(row, baselines, time_threshold, alloc_threshold, require_baseline=True):
+    """Why `row` fails the gate against its row in `baselines`, if any. A row
+    the baseline doesn't cover fails too, unless `require_baseline` is off
+    (when recording one), since it was checked against nothing."""
+    if row["kind"] == "error":
+        return [row["error"]]
+    problems = []
+    baseline = baselines.get(row_key(row))
+    if row.get("correct") is False:
+        problems.append(f"wrong sample answer {row['answer']!r}")
+    if baseline is None:
+        if require_baseline:
+            problems.append("no baseline to compare with")
+        return problems
+    if "answer" in row and "answer" in baseline and row["answer"] != baseline["answer"]:
+        problems.append(f"answer changed from {baseline['answer']!r}")
+    # A real slowdown moves the best run and the median alike, and by more
+    # than either run's repeats spread (min to p95); noise can push any one of
+    # those out on its own.
+    slower = min(row["min"] - baseline["min"], row["median"] - baseline["median"])
+    spread = max(row["p95"] - row["min"], baseline["p95"] - baseline["min"])
+    if slower > max(MIN_SECONDS, spread) and slower > baseline["min"] * time_threshold:
+        problems.append(f"{slower / baseline['min']:+.0%} slower")
+    peak, base_peak = row.get("traced_peak"), baseline.get("traced_peak")
+    if peak is not None and base_peak is not None:
+        grown = peak - base_peak
+        if grown > MIN_BYTES and grown > base_peak * alloc_threshold:
+            problems.append(f"traced peak {grown / max(base_peak, 1):+.0%} larger")
+    return problems
+
+
+def change(value, base):
+    if value is None or not base:
+        return "-"
+    return f"{(value - base) / base:+.0%}"
+
+
+def print_gate(rows, baselines, verdicts):
+    print(
+        f"{'DAY':>3}  {'PHASE':<6}  {'INPUT':<6}  {'MIN':>11}  {'CHANGE':>7}  "
+        f"{'PEAK':>11}  {'CHANGE':>7}  RESULT"
+    )
+    for row, problems in zip(rows, verdicts):
+        if row["kind"] == "error":
+            print(f"{row['day']:>3}  {'':<6}  {'error':<6}  {problems[0]}")
+            continue
+        baseline = baselines.get(row_key(row))
+        peak = row.get("traced_peak")
+        peak_text = "-" if peak is None else f"{peak / 1024:.0f}KiB"
+        result = "; ".join(problems) or ("ok" if baseline else "ok (no baseline)")
+        print(
+            f"{row['day']:>3}  {row['phase']:<6}  {row['kind']:<6}  {row['min']:>10.6f}s  "
+            f"{change(row['min'], baseline and baseline['min']):>7}  {peak_text:>11}  "
+            f"{change(peak, baseline and baseline.get('traced_peak')):>7}  {result}"
+        )
+
+
+def load_baseline(path):
+    with open(path, "r") as file:
+        report = json.load(file)
+    meta = report.get("meta", {})
+    if meta.get("python") and meta["python"] != platform.python_version():
+        print(
+            f"Note: baseline was recorded on Python {meta['python']}, "
+            f"this is {platform.python_version()}",
+            file=sys.stderr,
+        )
+    return {row_key(row): row for row in report["results"] if row["kind"] != "error"}
+
+
+def plan(days, parts, baselines):
+    """(day, parts) pairs to measure: the days asked for, else exactly what
+    the baseline holds (so a baseline recorded with -P covers only those)."""
+    if days:
+        return [(day, parts) for day in days]
+    if not baselines:
+        return [(day, parts) for day in available_days()]
+    recorded = {}
+    for row in baselines.values():
+        recorded.setdefault(row["day"], set())
+        if "part" in row:
+            recorded[row["day"]].add(row["part"])
+    selected = [
+        (day, [part for part in sorted(recorded[day]) if not parts or part in parts])
+        for day in sorted(recorded)
+    ]
+    return [(day, day_parts) for day, day_parts in selected if day_parts]
+
+
+def command_gate(args):
+    if args.repeats < 1 or args.warmup < 0:
+        sys.exit("--repeats must be at least 1 and --warmup not negative")
+    baselines = {}
+    if os.path.exists(args.baseline):
+        baselines = load_baseline(args.baseline)
+    elif not args.update:
+        sys.exit(f"No baseline at {args.baseline}; record one with --update")
+    rows = [
+        row
+        for day, parts in plan(args.days, args.parts, baselines)
+        for row in measure_day(day, parts, None, args.repeats, args.warmup)
+    ]
+    verdicts = [
+        regressions(row, baselines, args.threshold, args.alloc_threshold, not args.update)
+        for row in rows
+    ]
+    print_gate(rows, baselines, verdicts)
+    failures = sum(bool(problems) for problems in verdicts)
+    if args.update:
+        # Merge, so slow parts can be left out of a run without losing them.
+        merged = {**baselines, **{row_key(row): row for row in rows if row["kind"] != "error"}}
+        results = [merged[key] for key in sorted(merged)]
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        report = {"meta": metadata(args.repeats, args.warmup), "results": results}
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Baseline written to {args.baseline}")
+    print(f"{failures} of {len(rows)} checks failed")
+    return 1 if failures else 0
+
+
+def add_parser(commands):
+    gate = commands.add_parser(
+        "gate", help="Fail on slower, hungrier or wrong solvers against a stored baseline"
+    )
+    gate.add_argument("days", nargs="*", type=int, help="Days to check (default: the baseline's)")
+    gate.add_argument(
+        "-P", "--part", dest="parts", type=int, choices=PARTS, action="append",
+        help="Only check this part (repeatable)",
+    )
+    gate.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    gate.add_argument(
+        "--update", action="store_true", help="Record this run into the baseline"
+    )
+    gate.add_argument(
+        "-t", "--threshold", type=float, default=0.5,
+        help="Allowed slowdown of the fastest and median runs, as a fraction (default 0.5)",
+    )
+    gate.add_argument(
+        "-a", "--alloc-threshold", type=float, default=0.10,
+        help="Allowed traced-peak growth as a fraction (default 0.10)",
+    )
+    gate.add_argument("-r", "--repeats", help="Timed runs per part", type=int, default=5)
+    gate.add_argument("-w", "--warmup", help="Untimed runs first", type=int, default=1)
+    gate.set_defaults(func=command_gate)
@@ -0,0 +1,316 @@
+"""Seeded generators of valid puzzle inputs at arbitrary sizes.
+
+Each generator takes (size, rng) and yields input lines; what `size` counts is
+noted per day. Inputs follow the real formats closely enough for the day
+parsers, and are shaped so every solver has an answer (reachable summit,
+a directory big enough to delete, stacks that never run empty, ...)."""
+
+import json
+import random
+import string
+import sys
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def calories(size, rng):
+    """Day 1: `size` item lines, grouped into elves of 1-15 items."""
+    written = 0
+    while written < size:
+        if written:
+            yield ""
+        for _ in range(min(rng.randint(1, 15), size - written)):
+            yield str(rng.randint(1000, 70000))
+            written += 1
+
+
+def strategy_guide(size, rng):
+    """Day 2: `size` rounds."""
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def rucksack(pool, badge, rng):
+    # Halves share exactly one item, and the badge is somewhere in the sack.
+    shared = rng.choice(pool + [badge])
+    rest = [item for item in pool if item != shared]
+    rng.shuffle(rest)
+    left, right = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+    if badge != shared:
+        left.append(badge)
+    forced_left = [shared] if badge == shared else [shared, badge]
+    length = rng.randint(8, 16)
+    halves = []
+    for side, forced in ((left, forced_left), (right, [shared])):
+        half = forced + [rng.choice(side) for _ in range(length - len(forced))]
+        rng.shuffle(half)
+        halves.append("".join(half))
+    return "".join(halves)
+
+
+def rucksacks(size, rng):
+    """Day 3: `size` rucksacks, rounded up to whole groups of three."""
+    for _ in range((size + 2) // 3):
+        items = list(ITEMS)
+        rng.shuffle(items)
+        badge, others = items[0], items[1:]
+        # Disjoint pools per elf, so the badge is the only item all three carry.
+        for elf in range(3):
+            yield rucksack(others[elf * 17 : (elf + 1) * 17], badge, rng)
+
+
+def section_pairs(size, rng):
+    """Day 4: `size` assignment pairs."""
+    for _ in range(size):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            ranges.append(f"{start}-{rng.randint(start, 99)}")
+        yield ",".join(ranges)
+
+
+def crate_moves(size, rng, stacks=9):
+    """Day 5: `size` moves over nine stacks; no move ever empties a stack."""
+    heights = [rng.randint(2, 8) for _ in range(stacks)]
+    crates = [[rng.choice(string.ascii_uppercase) for _ in range(height)] for height in heights]
+    for level in range(max(heights), 0, -1):
+        row = [f"[{stack[-level]}]" if len(stack) >= level else "   " for stack in crates]
+        yield " ".join(row)
+    yield " ".join(f" {number} " for number in range(1, stacks + 1))
+    yield ""
+    for _ in range(size):
+        source = rng.choice([stack for stack in range(stacks) if heights[stack] > 1])
+        target = rng.choice([stack for stack in range(stacks) if stack != source])
+        count = rng.randint(1, heights[source] - 1)
+        heights[source] -= count
+        heights[target] += count
+        yield f"move {count} from {source + 1} to {target + 1}"
+
+
+def datastream(size, rng):
+    """Day 6: a `size` character stream (at least 15) whose first markers are
+    at its very end."""
+    # Three letters can never make four distinct in a row, so both scans run
+    # the whole stream before the 14 distinct letters at the end. The solver
+    # never looks at a window ending on the last character, so at least one
+    # prefix letter has to complete the 14 with the first 13 of them.
+    size = max(size, 15)
+    prefix = "".join(rng.choice("abc") for _ in range(size - 14))
+    yield prefix + "".join(rng.sample("defghijklmnopqrstuvwxyz", 14))
+
+
+def terminal_log(size, rng, max_depth=20):
+    """Day 7: a terminal session of roughly `size` lines."""
+    # The last `ls` can run up to ten lines past `size`, which matters when
+    # there are only a few: the other files' sizes stay under ~20M in total.
+    spread = max(1, 20_000_000 // (size + 10))
+    yield "$ cd /"
+    written = 1
+    # (entries still to visit in this directory, depth); starts at /.
+    stack = [(None, 0)]
+    first = True
+    while stack:
+        pending, depth = stack[-1]
+        if pending is None:
+            files = rng.randint(1, 6)
+            # / always gets a subdirectory for the big file below to go in.
+            growing = written < size or depth == 0
+            subdirs = rng.randint(1, 4) if depth < max_depth and growing else 0
+            names = [f"d{written}x{index}" for index in range(subdirs)]
+            yield "$ ls"
+            written += 1
+            for name in names:
+                yield f"dir {name}"
+            for index in range(files):
+                # One big file in the first subdirectory fills the disk past the
+                # 40M part 2 can leave used, and makes sure some directory is
+                # big enough to delete; the rest share under ~10M at any size.
+                file_size = 45_000_000 if first and depth == 1 else rng.randint(1, spread)
+                first = first and depth != 1
+                yield f"{file_size} f{index}.txt"
+            written += subdirs + files
+            stack[-1] = (names, depth)
+            continue
+        if pending and (written < size or first):
+            name = pending.pop()
+            yield f"$ cd {name}"
+            written += 1
+            stack.append((None, depth + 1))
+            continue
+        stack.pop()
+        if stack:
+            yield "$ cd .."
+            written += 1
+
+
+def tree_grid(size, rng):
+    """Day 8: a `size` x `size` grid of tree heights."""
+    for _ in range(size):
+        yield "".join(rng.choice(string.digits) for _ in range(size))
+
+
+def rope_moves(size, rng):
+    """Day 9: `size` head moves."""
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
+
+
+def cpu_program(size, rng):
+    """Day 10: a program for exactly the 240 cycles the CRT has room for.
+
+    The CRT is six fixed 40-pixel rows, so this input cannot grow; `size` is
+    ignored."""
+    cycles = 0
+    x = 1
+    while cycles < 240:
+        if cycles <= 238 and rng.random() < 0.6:
+            value = rng.randint(-10, 10)
+            value = max(-x + 1, min(value, 38 - x))
+            x += value
+            cycles += 2
+            yield f"addx {value}"
+        else:
+            cycles += 1
+            yield "noop"
+
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
+
+
+def monkey_notes(size, rng, monkeys=8):
+    """Day 11: `size` starting items spread over eight monkeys."""
+    holdings = [[] for _ in range(monkeys)]
+    for index in range(max(size, monkeys)):
+        monkey = index if index < monkeys else rng.randrange(monkeys)
+        holdings[monkey].append(rng.randint(50, 99))
+    divisors = rng.sample(PRIMES, monkeys)
+    for monkey in range(monkeys):
+        if monkey:
+            yield ""
+        operation = rng.choice(
+            [f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}", "old * old"]
+        )
+        if_true, if_false = rng.sample([other for other in range(monkeys) if other != monkey], 2)
+        yield f"Monkey {monkey}:"
+        yield f"  Starting items: {', '.join(map(str, holdings[monkey]))}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {divisors[monkey]}"
+        yield f"    If true: throw to monkey {if_true}"
+        yield f"    If false: throw to monkey {if_false}"
+
+
+def climb(length, rng):
+    # A walk from 0 to 13 in `length` steps of 0 or +1.
+    steps = set(rng.sample(range(1, length), 13))
+    heights, height = [], 0
+    for index in range(length):
+        height += index in steps
+        heights.append(height)
+    return heights
+
+
+def heightmap(size, rng):
+    """Day 12: a `size` x `size` heightmap (at least 14 x 14).
+
+    Height is a[x] + b[y] for two random non-decreasing walks, so neighbours
+    never differ by more than one and E (the far corner) is always reachable
+    from S and from the flat 'a' region around it."""
+    size = max(size, 14)
+    columns, rows = climb(size, rng), climb(size, rng)
+    for y, row in enumerate(rows):
+        line = [string.ascii_lowercase[min(25, column + row)] for column in columns]
+        if y == 0:
+            line[0] = "S"
+        if y == size - 1:
+            line[-1] = "E"
+        yield "".join(line)
+
+
+def packet(rng, depth=0):
+    if depth >= 4 or rng.random() < 0.3:
+        return rng.randint(0, 10)
+    return [packet(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+
+
+def packet_pairs(size, rng):
+    """Day 13: `size` packet pairs."""
+    for index in range(size):
+        if index:
+            yield ""
+        for _ in range(2):
+            values = [packet(rng, 1) for _ in range(rng.randint(0, 5))]
+            yield json.dumps(values, separators=(",", ":"))
+
+
+def rock_paths(size, rng):
+    """Day 14: `size` rock paths in a cave up to ~490 deep.
+
+    The depth is capped so the floor in part 2 stays inside the map the day
+    allocates (twice the widest x), which in turn is pinned by the first path."""
+    depth = min(490, 20 + size // 2)
+    far = 500 + depth + 5
+    yield f"{far},{depth} -> {far},{depth - 2}"
+    for _ in range(size - 1):
+        x, y = rng.randint(500 - depth, 500 + depth), rng.randint(10, depth)
+        vertices = [(x, y)]
+        for turn in range(rng.randint(1, 5)):
+            step = rng.randint(1, 8) * rng.choice((-1, 1))
+            if turn % 2:
+                y = max(10, min(depth, y + step))
+            else:
+                x = max(500 - depth, min(500 + depth, x + step))
+            vertices.append((x, y))
+        yield " -> ".join(f"{x},{y}" for x, y in vertices)
+
+
+GENERATORS = {
+    1: calories,
+    2: strategy_guide,
+    3: rucksacks,
+    4: section_pairs,
+    5: crate_moves,
+    6: datastream,
+    7: terminal_log,
+    8: tree_grid,
+    9: rope_moves,
+    10: cpu_program,
+    11: monkey_notes,
+    12: heightmap,
+    13: packet_pairs,
+    14: rock_paths,
+}
+
+
+def generate(day, size, seed=0):
+    """Yield the lines of a day `day` input of the given size."""
+    if day not in GENERATORS:
+        raise KeyError(f"No input generator for day {day}")
+    return GENERATORS[day](size, random.Random(f"{day}:{size}:{seed}"))
+
+
+def generate_text(day, size, seed=0):
+    return "\n".join(generate(day, size, seed)) + "\n"
+
+
+def write_input(day, size, path, seed=0):
+    with open(path, "w") as file:
+        for line in generate(day, size, seed):
+            file.write(line + "\n")
+
+
+def command_generate(args):
+    if args.output:
+        write_input(args.day, args.size, args.output, args.seed)
+        return 0
+    for line in generate(args.day, args.size, args.seed):
+        sys.stdout.write(line + "\n")
+    return 0
+
+
+def add_parser(commands):
+    generate_command = commands.add_parser("generate", help="Write a synthetic input")
+    generate_command.add_argument("day", type=int, choices=sorted(GENERATORS))
+    generate_command.add_argument("size", type=int, help="Input size; see aoc.generators")
+    generate_command.add_argument("--seed", type=int, default=0)
+    generate_command.add_argument("-o", "--output", help="Write here instead of stdout")
+    generate_command.set_defaults(func=command_generate)
@@ -0,0 +1,78 @@
+class Grid:
+    """A rectangle of one-byte cells stored row by row in a single bytearray.
+
+    The rectangle is wrapped in a one-cell border of `border` bytes, so every
+    cell's neighbours sit at the fixed offsets in self.orthogonal and no
+    lookup ever needs a bounds check: solvers treat the border byte as a wall.
+
+    Cells are addressed by flat index; index() and coordinate() convert to and
+    from (x, y). Whole-grid work (finding, rows, columns, remapping) runs as
+    bytes operations in C rather than Python loops."""
+
+    def __init__(self, width, height, fill=b".", border=b"\0"):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.border = border[0]
+        edge = border * self.stride
+        self.cells = bytearray(edge + (border + fill * width + border) * height + edge)
+        self.orthogonal = (-1, 1, -self.stride, self.stride)
+
+    @classmethod
+    def from_rows(cls, rows, border=b"\0"):
+        """Grid of equal-length rows (str or bytes), e.g. input lines."""
+        rows = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        grid = cls(len(rows[0]), len(rows), border=border)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start : start + grid.width] = row
+        return grid
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + x + 1
+
+    def coordinate(self, index):
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def neighbours(self, index):
+        """Indexes next to `index` (no diagonals) that are inside the grid."""
+        cells, border = self.cells, self.border
+        return [index + offset for offset in self.orthogonal if cells[index + offset] != border]
+
+    def find(self, values):
+        """Indexes of every cell holding one of `values` (bytes), in order."""
+        found = []
+        for value in values:
+            index = self.cells.find(value)
+            while index != -1:
+                found.append(index)
+                index = self.cells.find(value, index + 1)
+        return sorted(found)
+
+    def row(self, y):
+        start = self.index(0, y)
+        return bytes(self.cells[start : start + self.width])
+
+    def column(self, x):
+        return bytes(self.cells[self.index(x, 0) : self.index(x, self.height) : self.stride])
+
+    def translate(self, table):
+        """A copy with every byte (the border's too) mapped through `table`,
+        a bytes.maketrans()-style 256-byte table."""
+        grid = self.copy()
+        grid.cells = bytearray(self.cells.translate(table))
+        grid.border = table[self.border]
+        return grid
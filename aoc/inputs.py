@@ -0,0 +1,91 @@
+import hashlib
+import io
+import mmap
+import os
+from contextlib import contextmanager
+
+
+class PuzzleInput:
+    """A puzzle input that is only read when, and as, a solver asks for it.
+
+    text() reads it whole (once), lines() streams it line by line in constant
+    memory, and buffer() maps the file read-only for solvers that scan bytes."""
+
+    def __init__(self, path=None, text=None):
+        self.path = path
+        self._text = text
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(path=path)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(text=text)
+
+    def __len__(self):
+        if self._text is not None:
+            return len(self._text)
+        return os.path.getsize(self.path)
+
+    def text(self):
+        if self._text is None:
+            with open(self.path, "r") as file:
+                self._text = file.read()
+        return self._text
+
+    def digest(self):
+        """sha256 of the input's bytes, hashed in chunks for files."""
+        if self.path is None:
+            return hashlib.sha256(self._text.encode()).hexdigest()
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def raw_lines(self):
+        if self._text is not None:
+            yield from io.StringIO(self._text)
+            return
+        with open(self.path, "r") as file:
+            yield from file
+
+    @contextmanager
+    def buffer(self):
+        """The input's bytes: the file mapped read-only, or the text encoded.
+        Both slice to bytes and support find(), so byte scanners take either."""
+        if self._text is not None:
+            yield self._text.encode()
+            return
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # mmap refuses zero-length files.
+                yield b""
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+def lines(source):
+    """Yield the lines of `source` (a str, PuzzleInput or iterable of lines)
+    without line endings, dropping blank lines at the very start and end the
+    way text.strip().split("\\n") does, but without holding the text."""
+    if isinstance(source, str):
+        raw = io.StringIO(source)
+    elif isinstance(source, PuzzleInput):
+        raw = source.raw_lines()
+    else:
+        raw = source
+    started = False
+    blank = 0
+    for line in raw:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            blank += started
+            continue
+        started = True
+        for _ in range(blank):
+            yield ""
+        blank = 0
+        yield line
@@ -0,0 +1,111 @@
+import multiprocessing
+import resource
+import sys
+from multiprocessing.connection import wait
+from time import monotonic
+
+from aoc.runner import error_row
+
+MIB = 1024 * 1024
+
+
+class LimitExceeded(Exception):
+    """A day ran past its wall-clock or memory limit."""
+
+
+def overrun_row(day, limit, message):
+    row = error_row(day, LimitExceeded(message))
+    row["limit"] = limit
+    return row
+
+
+def worker(connection, memory, function, args):
+    if memory:
+        # Address space rather than RSS: the kernel enforces it as the solver
+        # allocates, so the day fails with a MemoryError instead of swapping.
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    try:
+        result = ("rows", function(*args))
+    except BaseException as error:
+        result = ("error", f"{type(error).__name__}: {error}")
+    connection.send(result)
+    connection.close()
+
+
+def collect(day, receiver, process, memory):
+    try:
+        status, result = receiver.recv()
+    except EOFError:
+        status, result = "error", None
+    receiver.close()
+    process.join()
+    if status == "error":
+        message = result or f"worker exited with code {process.exitcode}"
+        result = [{"day": day, "kind": "error", "error": message}]
+    for row in result:
+        # Solvers report their own failures as error rows, so a MemoryError
+        # under a cap usually shows up there rather than as a dead worker.
+        if memory and row["kind"] == "error" and row["error"].startswith("MemoryError"):
+            row.update(overrun_row(day, "memory", f"went past the {memory / MIB:g} MiB limit"))
+    return result
+
+
+def run_limited(tasks, seconds=None, memory=None, jobs=1):
+    """Run each (day, function, args) task in a worker process of its own, at
+    most `jobs` at once, and return all their rows in task order.
+
+    `function(*args)` must return a list of rows. A worker still going after
+    `seconds` is killed, and one allocating past `memory` bytes fails; either
+    way the day gets an error row with "limit" set to "time" or "memory"
+    instead of holding up every day after it."""
+    context = multiprocessing.get_context()
+    pending = list(enumerate(tasks))
+    running = {}
+    results = [[] for _ in tasks]
+    while pending or running:
+        while pending and len(running) < max(jobs, 1):
+            index, (day, function, args) = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=worker, args=(sender, memory, function, args), daemon=True
+            )
+            process.start()
+            sender.close()
+            deadline = monotonic() + seconds if seconds else None
+            running[receiver] = (index, day, process, deadline)
+        deadlines = [deadline for *_, deadline in running.values() if deadline is not None]
+        timeout = max(0, min(deadlines) - monotonic()) if deadlines else None
+        for receiver in wait(list(running), timeout):
+            index, day, process, _ = running.pop(receiver)
+            results[index] = collect(day, receiver, process, memory)
+        now = monotonic()
+        for receiver, (index, day, process, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                process.kill()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                results[index] = [
+                    overrun_row(day, "time", f"still running after {seconds:g}s; killed")
+                ]
+    return [row for rows in results for row in rows]
+
+
+def add_limit_arguments(parser):
+    parser.add_argument(
+        "--timeout", type=float, metavar="SECONDS",
+        help="Kill a day still running after this long (runs each day in its own process)",
+    )
+    parser.add_argument(
+        "--memory-limit", type=int, metavar="MIB",
+        help="Fail a day whose worker process allocates past this much address space",
+    )
+
+
+def limits_from_args(args):
+    """(seconds, bytes) from --timeout/--memory-limit; (None, None) if unset."""
+    if (args.timeout is not None and args.timeout <= 0) or (
+        args.memory_limit is not None and args.memory_limit <= 0
+    ):
+        sys.exit("--timeout and --memory-limit must be positive")
+    return args.timeout, args.memory_limit and args.memory_limit * MIB
@@ -0,0 +1,143 @@
+import os
+import sys
+import tracemalloc
+
+from aoc.days import ROOT
+from aoc.runner import phase_name
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def reset_peak_rss():
+    """Restart the kernel's peak-RSS count (VmHWM) from the current RSS.
+
+    Linux only; elsewhere the peak can't be reset, so it covers the whole
+    process so far rather than just the phase."""
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def status_bytes(field):
+    with open("/proc/self/status", "r") as file:
+        for line in file:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def rss_bytes():
+    """(current RSS, peak RSS) in bytes; either may be None if unavailable."""
+    try:
+        return status_bytes("VmRSS"), status_bytes("VmHWM")
+    except OSError:
+        pass
+    if resource is None:
+        return None, None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and BSD, bytes on macOS.
+    return None, peak if sys.platform == "darwin" else peak * 1024
+
+
+def site(frame):
+    path = os.path.relpath(frame.filename, ROOT)
+    if path.startswith(".."):
+        path = os.path.basename(frame.filename)
+    return f"{path}:{frame.lineno}"
+
+
+class TrackedPhase:
+    """Context manager measuring memory over one phase.
+
+    tracemalloc runs only inside the phase, so its peak and the allocation
+    sites are the phase's own; tracing slows the solver down, so timings
+    taken alongside are inflated."""
+
+    def __init__(self, tracker, day, kind, group, phase):
+        self.tracker = tracker
+        # With the parts, as day 9 parses a different sample for each.
+        self.key = (day, kind, tuple(group), phase)
+
+    def __enter__(self):
+        self.rss_phase = reset_peak_rss()
+        self.rss_start = rss_bytes()[0]
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        tracemalloc.stop()
+        rss_peak = rss_bytes()[1]
+        self.tracker.records[self.key] = {
+            "traced_peak": peak,
+            "traced_retained": retained,
+            "rss_start": self.rss_start,
+            "rss_peak": rss_peak,
+            "rss_scope": "phase" if self.rss_phase else "process",
+            "top": [
+                {"site": site(stat.traceback[0]), "size": stat.size, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[: self.tracker.top]
+            ],
+        }
+
+
+class MemoryTracker:
+    """Peak RSS, tracemalloc peak and the top allocation sites still live at
+    the end of each phase Day.solve runs."""
+
+    def __init__(self, top=10):
+        self.top = top
+        self.records = {}
+
+    def wrap(self, day, kind, group):
+        return lambda phase: TrackedPhase(self, day, kind, group, phase_name(phase))
+
+    def annotate(self, rows):
+        """Attach each phase's measurements to its report row as "memory"."""
+        for row in rows:
+            key = (row["day"], row["kind"], tuple(row.get("group", ())), row.get("phase"))
+            if key in self.records:
+                row["memory"] = self.records[key]
+
+    def print_memory(self):
+        print(
+            f"\n{'DAY':>3}  {'PHASE':<6}  {'INPUT':<6}  {'PARTS':<5}  {'RSS PEAK':>10}  "
+            f"{'TRACED PEAK':>11}  {'RETAINED':>10}"
+        )
+        for (day, kind, group, phase), record in self.records.items():
+            rss = "-" if record["rss_peak"] is None else mebibytes(record["rss_peak"])
+            if record["rss_scope"] == "process":
+                rss += "*"
+            print(
+                f"{day:>3}  {phase:<6}  {kind:<6}  {','.join(map(str, group)):<5}  {rss:>10}  "
+                f"{mebibytes(record['traced_peak']):>11}  "
+                f"{mebibytes(record['traced_retained']):>10}"
+            )
+        if any(record["rss_scope"] == "process" for record in self.records.values()):
+            print("* peak RSS of the whole process; this platform can't reset it per phase")
+        for (day, kind, group, phase), record in self.records.items():
+            if not record["top"]:
+                continue
+            parts = ", ".join(map(str, group))
+            print(f"\nDay {day} {kind} (parts {parts}) {phase}: largest allocations still live")
+            print(f"{'SIZE':>10}  {'BLOCKS':>8}  SITE")
+            for entry in record["top"]:
+                print(f"{mebibytes(entry['size']):>10}  {entry['count']:>8}  {entry['site']}")
+
+
+def mebibytes(size):
+    return f"{size / (1024 * 1024):.2f}MiB"
@@ -0,0 +1,129 @@
+import cProfile
+import os
+import pstats
+
+from aoc.days import ROOT
+from aoc.runner import phase_name
+
+
+def label(function):
+    filename, line, name = function
+    if filename == "~":
+        # Builtins, e.g. "<built-in method builtins.min>".
+        return name
+    path = os.path.relpath(filename, ROOT)
+    if path.startswith(".."):
+        path = os.path.basename(filename)
+    return f"{name} ({path}:{line})"
+
+
+def is_profiler(function):
+    # The profiler's own disable() and the __exit__ that calls it.
+    filename, _, name = function
+    return filename == __file__ or (filename == "~" and "_lsprof.Profiler" in name)
+
+
+def collapsed_stacks(stats, min_seconds=1e-6, max_depth=64):
+    """{"outer;...;inner": seconds} for flame graph tools, rebuilt from stats.
+
+    cProfile keeps caller -> callee edges rather than whole stacks, so each
+    function's own time is walked up its callers, split between them in
+    proportion to the time each edge accounts for. Exact for the tree-shaped
+    call graphs most solvers have; an approximation where a function is
+    reached along several paths."""
+    raw = stats.stats
+    stacks = {}
+
+    def walk(path, seconds):
+        callers = {
+            caller: edge
+            for caller, edge in raw[path[-1]][4].items()
+            if caller in raw and caller not in path and not is_profiler(caller)
+        }
+        if not callers or len(path) >= max_depth:
+            stack = ";".join(label(function) for function in reversed(path))
+            stacks[stack] = stacks.get(stack, 0) + seconds
+            return
+        # edge = (primitive calls, calls, own time, cumulative time) from that caller.
+        shares = {caller: edge[3] for caller, edge in callers.items()}
+        total = sum(shares.values())
+        if not total:
+            shares = {caller: edge[1] for caller, edge in callers.items()}
+            total = sum(shares.values())
+        for caller, share in shares.items():
+            weight = seconds * share / total
+            if weight >= min_seconds:
+                walk(path + [caller], weight)
+
+    for function, (_, _, own_seconds, _, _) in raw.items():
+        if own_seconds >= min_seconds and not is_profiler(function):
+            walk([function], own_seconds)
+    return stacks
+
+
+class ProfiledPhase:
+    """Context manager profiling one phase; a class rather than a generator so
+    nothing but its own __exit__ runs between the phase and disable()."""
+
+    def __init__(self, profiler, day, kind, group, phase):
+        self.profiler = profiler
+        self.key = (day, kind, tuple(group), phase)
+        self.profile = cProfile.Profile()
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.profiler.save(*self.key, pstats.Stats(self.profile))
+
+
+class PhaseProfiler:
+    """Profiles each phase Day.solve runs into its own cProfile.Profile.
+
+    For every (day, input, parts, phase) it writes NAME.pstats (load it with pstats
+    or snakeviz) and NAME.collapsed (one "stack microseconds" line per stack,
+    for flamegraph.pl or speedscope) under `directory`."""
+
+    def __init__(self, directory, top=10):
+        self.directory = directory
+        self.top = top
+        self.profiles = []
+
+    def wrap(self, day, kind, group):
+        return lambda phase: ProfiledPhase(self, day, kind, group, phase_name(phase))
+
+    def save(self, day, kind, group, phase, stats):
+        os.makedirs(self.directory, exist_ok=True)
+        # The parts are in the name because day 9 parses a different sample
+        # for each, and both parse phases would otherwise share a file.
+        parts = "".join(map(str, group))
+        name = os.path.join(
+            self.directory, f"day{day:02}-{kind}-p{parts}-{phase.replace(' ', '')}"
+        )
+        stats.dump_stats(f"{name}.pstats")
+        with open(f"{name}.collapsed", "w") as file:
+            for stack, seconds in sorted(collapsed_stacks(stats).items()):
+                file.write(f"{stack} {round(seconds * 1e6)}\n")
+        self.profiles.append((day, kind, group, phase, stats))
+
+    def print_top(self):
+        for day, kind, group, phase, stats in self.profiles:
+            hottest = sorted(
+                (
+                    (own_seconds, cumulative, calls, function)
+                    for function, (_, calls, own_seconds, cumulative, _) in stats.stats.items()
+                    if not is_profiler(function)
+                ),
+                reverse=True,
+            )[: self.top]
+            parts = ", ".join(map(str, group))
+            print(f"\nDay {day} {kind} (parts {parts}) {phase}: {stats.total_tt:.6f}s profiled")
+            print(f"{'CALLS':>10}  {'OWN':>11}  {'CUMULATIVE':>11}  FUNCTION")
+            for own_seconds, cumulative, calls, function in hottest:
+                print(
+                    f"{calls:>10}  {own_seconds:>10.6f}s  {cumulative:>10.6f}s  "
+                    f"{label(function)}"
+                )
+        print(f"\nProfiles written to {self.directory}")
@@ -0,0 +1,357 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from aoc.days import PARTS, Day, available_days
+from aoc.cache import DEFAULT_MAX_BYTES, DEFAULT_PATH, ResultCache, input_digest
+from aoc.inputs import PuzzleInput
+
+
+def read_input(day, inputfile=None):
+    if inputfile:
+        return PuzzleInput.from_file(inputfile)
+    return day.puzzle_input()
+
+
+def by_input(parts, input_for):
+    groups = {}
+    for part in parts:
+        groups.setdefault(input_for(part), []).append(part)
+    return groups.items()
+
+
+def workloads(puzzle_day, parts, inputfile=None, sample=True):
+    """Yield (kind, input_text, parts, load_seconds) for everything a run of
+    this day covers. Samples are embedded constants, so they have no load time;
+    for days that stream their input, reading happens inside the parts."""
+    if sample:
+        for input_text, group in by_input(parts, puzzle_day.sample_input):
+            yield "sample", input_text, group, None
+    source = read_input(puzzle_day, inputfile)
+    if source and parts:
+        start_time = perf_counter()
+        input_text = puzzle_day.prepare(source)
+        yield "input", input_text, parts, perf_counter() - start_time
+
+
+def select_parts(puzzle_day, parts=None):
+    return [part for part in parts or PARTS if part in puzzle_day.parts]
+
+
+def phase_name(phase):
+    return f"part {phase}" if phase in PARTS else phase
+
+
+def error_row(day, error):
+    return {"day": day, "kind": "error", "error": f"{type(error).__name__}: {error}"}
+
+
+def solve_cached(puzzle_day, input_text, parts, cache, engine=None):
+    """Day.solve, answering what it can from `cache` and storing the rest.
+
+    Cached parts come back with their originally measured time and are listed
+    in the returned set of cached parts."""
+    digest = input_digest(input_text)
+    source = puzzle_day.source_digest()
+    if engine:
+        # Same answers, but each engine's timings are its own.
+        source = f"{source}:{engine}"
+    hits = {}
+    for part in parts:
+        hit = cache.get(puzzle_day.day, part, digest, source)
+        if hit is not None:
+            hits[part] = hit
+    missing = [part for part in parts if part not in hits]
+    answers, timings = (
+        puzzle_day.solve(input_text, missing, engine=engine) if missing else ({}, {})
+    )
+    for part in missing:
+        cache.put(puzzle_day.day, part, digest, source, answers[part], timings[part])
+    for part, (answer, seconds) in hits.items():
+        answers[part] = answer
+        timings[part] = seconds
+    return answers, timings, set(hits)
+
+
+def run_day(
+    day, parts=None, inputfile=None, sample=True, cache=None, instrument=None, engine=None
+):
+    """Solve one day and return its result rows, one per (input, phase).
+
+    Phases are "import" (loading NN/code.py), "load" (reading the input),
+    "parse" (building the Puzzle) and "part 1"/"part 2"; only part rows carry
+    an answer, and answers taken from `cache` are flagged "cached". Runs in
+    worker processes too, so it only takes and returns plain data (an
+    `instrument`, a PhaseProfiler or MemoryTracker wrapped around each phase,
+    only works in-process). Failures are recorded as an "error" row rather
+    than raised, so one broken day never takes the rest of the report down
+    with it."""
+    rows = []
+    try:
+        start_time = perf_counter()
+        puzzle_day = Day(day)
+        rows.append(
+            {"day": day, "kind": "-", "phase": "import", "seconds": perf_counter() - start_time}
+        )
+        parts = select_parts(puzzle_day, parts)
+        for kind, input_text, group, load_seconds in workloads(
+            puzzle_day, parts, inputfile, sample
+        ):
+            if load_seconds is not None:
+                rows.append({"day": day, "kind": kind, "phase": "load", "seconds": load_seconds})
+            if cache is None:
+                wrap = instrument.wrap(day, kind, group) if instrument else None
+                answers, timings = puzzle_day.solve(input_text, group, wrap, engine)
+                cached = set()
+            else:
+                answers, timings, cached = solve_cached(
+                    puzzle_day, input_text, group, cache, engine
+                )
+            phases = [phase for phase in ("parse", *PARTS) if phase in timings]
+            for phase in phases:
+                seconds = timings[phase]
+                row = {"day": day, "kind": kind, "phase": phase_name(phase), "group": group}
+                if phase in answers:
+                    row["part"] = phase
+                    row["answer"] = answers[phase]
+                    if kind == "sample":
+                        row["expected"] = puzzle_day.sample_solution(phase)
+                        row["correct"] = row["answer"] == row["expected"]
+                    if phase in cached:
+                        row["cached"] = True
+                row["seconds"] = seconds
+                rows.append(row)
+    except Exception as error:
+        rows.append(error_row(day, error))
+    return rows
+
+
+def run_days(
+    days,
+    parts=None,
+    inputfile=None,
+    sample=True,
+    jobs=1,
+    cache=None,
+    instrument=None,
+    engine=None,
+    timeout=None,
+    memory_limit=None,
+):
+    if timeout or memory_limit:
+        from aoc.limits import run_limited
+
+        tasks = [
+            (day, run_day, (day, parts, inputfile, sample, cache, None, engine)) for day in days
+        ]
+        return run_limited(tasks, timeout, memory_limit, jobs)
+    if jobs <= 1 or len(days) <= 1:
+        return [
+            row
+            for day in days
+            for row in run_day(day, parts, inputfile, sample, cache, instrument, engine)
+        ]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(run_day, day, parts, inputfile, sample, cache, None, engine)
+            for day in days
+        ]
+        return [row for future in futures for row in future.result()]
+
+
+def show_text(days, showpuzzle, showsample):
+    if not (showpuzzle or showsample):
+        return
+    for day in days:
+        puzzle_day = Day(day)
+        module = puzzle_day.module
+        if showpuzzle:
+            print(f"###############\nAOC 2022 DAY {day} PUZZLE TEXT\n###############")
+            print(puzzle_day.puzzle_text())
+        if showsample:
+            print(f"###############\nAOC 2022 DAY {day} SAMPLE INPUT\n###############")
+            print(module.SAMPLE_INPUT.strip())
+            if getattr(module, "P2_SAMPLE_INPUT", False):
+                print(
+                    f"###############\nAOC 2022 DAY {day} P2 SAMPLE INPUT\n###############"
+                )
+                print(module.P2_SAMPLE_INPUT.strip())
+            for part in PARTS:
+                print(
+                    f"\n###############\nAOC 2022 DAY {day} P{part} SAMPLE SOLUTION\n###############"
+                )
+                print(getattr(module, f"P{part}_SAMPLE_SOLUTION"))
+
+
+def format_answer(row):
+    if row["kind"] == "error":
+        return row["error"]
+    if "answer" not in row:
+        return ""
+    answer = str(row["answer"])
+    if "\n" in answer:
+        # Day 10's CRT image; print it under the row instead of breaking the table.
+        answer = "\n" + "\n".join(f"    {line}" for line in answer.strip("\n").split("\n"))
+    if row.get("cached"):
+        answer = f"{answer} (cached)"
+    if row["kind"] == "sample":
+        if row["correct"]:
+            return f"ok {answer}"
+        return f"FAILED expected {row['expected']!r}, got {answer}"
+    return answer
+
+
+def print_report(rows):
+    print(f"{'DAY':>3}  {'PHASE':<6}  {'INPUT':<6}  {'TIME':>12}  ANSWER")
+    for row in rows:
+        seconds = f"{row['seconds']:.6f}s" if "seconds" in row else ""
+        print(
+            f"{row['day']:>3}  {row.get('phase', ''):<6}  {row['kind']:<6}  "
+            f"{seconds:>12}  {format_answer(row)}"
+        )
+    for phase in ("import", "load", "parse", "part 1", "part 2"):
+        total = sum(
+            row["seconds"]
+            for row in rows
+            if row.get("phase") == phase and not row.get("cached")
+        )
+        print(f"Total {phase:<6} {total:.6f}s")
+
+
+def failed(rows):
+    return any(row["kind"] == "error" or row.get("correct") is False for row in rows)
+
+
+def command_run(args):
+    from aoc.limits import limits_from_args
+
+    days = selected_days(args)
+    show_text(days, args.showpuzzle, args.showsample)
+    cache = cache_from_args(args)
+    timeout, memory_limit = limits_from_args(args)
+    instrument = None
+    if args.profile or args.memory:
+        if args.profile and args.memory:
+            sys.exit("--profile and --memory skew each other; use one at a time")
+        if cache or args.jobs > 1 or timeout or memory_limit:
+            sys.exit(
+                "--profile and --memory run in one process, without --cache, --jobs or limits"
+            )
+        if args.profile:
+            from aoc.profiling import PhaseProfiler
+
+            instrument = PhaseProfiler(args.profile, args.top)
+        else:
+            from aoc.memory import MemoryTracker
+
+            instrument = MemoryTracker(args.top)
+    rows = run_days(
+        days,
+        args.parts,
+        args.inputfile,
+        not args.nosample,
+        args.jobs,
+        cache,
+        instrument,
+        args.engine,
+        timeout,
+        memory_limit,
+    )
+    if args.memory:
+        instrument.annotate(rows)
+    print_report(rows)
+    if args.profile:
+        instrument.print_top()
+    if args.memory:
+        instrument.print_memory()
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(rows, file, indent=2)
+    return 1 if failed(rows) else 0
+
+
+def add_day_arguments(parser):
+    parser.add_argument("days", nargs="*", type=int, help="Days to run (default: all)")
+    parser.add_argument(
+        "-P", "--part", dest="parts", type=int, choices=PARTS, action="append",
+        help="Only run this part (repeatable)",
+    )
+    parser.add_argument("-i", "--inputfile", help="Puzzle Input", type=str)
+    parser.add_argument(
+        "-n", "--nosample", help="Skip the sample check", action="store_true"
+    )
+    parser.add_argument(
+        "-e", "--engine", help="Solve with this engine from the day's ENGINES"
+    )
+
+
+def add_cache_arguments(parser):
+    parser.add_argument(
+        "-c", "--cache", help="Reuse answers for unchanged inputs/code", action="store_true"
+    )
+    parser.add_argument("--cache-dir", help="Cache database file", default=DEFAULT_PATH)
+    parser.add_argument(
+        "--cache-size", help="Cache size cap in MiB", type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+    )
+
+
+def cache_from_args(args):
+    if not args.cache:
+        return None
+    return ResultCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+
+def selected_days(args):
+    days = args.days or available_days()
+    if args.inputfile and len(days) != 1:
+        sys.exit("--inputfile needs exactly one day")
+    return days
+
+
+def build_parser():
+    from aoc import batch, bench, differential, gate, generators, scaling, server, watch
+    from aoc.limits import add_limit_arguments
+
+    parser = argparse.ArgumentParser(description="AOC2022 Puzzle Runner")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Solve one or more days in one process")
+    add_day_arguments(run)
+    run.add_argument("-p", "--showpuzzle", help="Display Puzzle Text", action="store_true")
+    run.add_argument("-s", "--showsample", help="Display Sample Input", action="store_true")
+    run.add_argument("-j", "--jobs", help="Worker processes", type=int, default=1)
+    run.add_argument("--json", help="Also write the report to this JSON file")
+    run.add_argument(
+        "--profile", metavar="DIR",
+        help="Profile parse and each part; write .pstats and .collapsed files to DIR",
+    )
+    run.add_argument(
+        "--memory", action="store_true",
+        help="Measure peak RSS, tracemalloc peak and allocation sites per phase",
+    )
+    run.add_argument(
+        "--top", type=int, default=10,
+        help="Functions (--profile) or allocation sites (--memory) to list per phase",
+    )
+    add_cache_arguments(run)
+    add_limit_arguments(run)
+    run.set_defaults(func=command_run)
+
+    bench.add_parser(commands)
+    gate.add_parser(commands)
+    batch.add_parser(commands)
+    differential.add_parser(commands)
+    generators.add_parser(commands)
+    scaling.add_parser(commands)
+    server.add_parser(commands)
+    watch.add_parser(commands)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sys.exit(args.func(args))
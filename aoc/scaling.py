@@ -0,0 +1,192 @@
+import json
+import math
+import statistics
+import sys
+
+from aoc.bench import metadata
+from aoc.days import PARTS, Day, quiet
+from aoc.generators import generate_text
+from aoc.inputs import PuzzleInput
+from aoc.runner import phase_name, select_parts
+
+# First size of each day's series, in that day's generator units (see
+# aoc.generators). Small enough that the quadratic-and-worse days get a few
+# points in before --max-seconds stops them. Day 10's input can't grow.
+START_SIZES = {
+    1: 10_000,
+    2: 10_000,
+    3: 3_000,
+    4: 10_000,
+    5: 2_000,
+    6: 100_000,
+    7: 10_000,
+    8: 16,
+    9: 1_000,
+    11: 8,
+    12: 14,
+    13: 100,
+    14: 20,
+}
+
+# Growth exponent against generator size that a reasonable solver would show;
+# anything not listed should be linear. Days 8 and 12 are sized by the side of
+# a square grid, and day 14's cave (so its sand) deepens with the path count.
+EXPECTED = {
+    8: {"parse": 2.0, "part 1": 2.0, "part 2": 2.0},
+    12: {"parse": 2.0, "part 1": 2.0, "part 2": 2.0},
+    14: {"part 1": 2.0, "part 2": 2.0},
+}
+
+# Below this a phase is timer noise, not a measurement worth fitting.
+MIN_SECONDS = 1e-4
+
+
+def expected_exponent(day, phase):
+    return EXPECTED.get(day, {}).get(phase, 1.0)
+
+
+def fit_exponent(points):
+    """Slope of log(seconds) against log(size), or None with too few points.
+
+    Size rather than bytes: day 11's text is mostly fixed monkey notes, so its
+    length barely moves while the work grows with every item added."""
+    usable = [point for point in points if point["seconds"] >= MIN_SECONDS]
+    if len(usable) < 3:
+        return None
+    xs = [math.log(point["size"]) for point in usable]
+    ys = [math.log(point["seconds"]) for point in usable]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def measure(puzzle_day, text, parts, repeats):
+    """Median seconds per phase over `repeats` solves of one input."""
+    samples = {}
+    with quiet():
+        for _ in range(repeats):
+            input_text = puzzle_day.prepare(PuzzleInput.from_text(text))
+            _, timings = puzzle_day.solve(input_text, parts)
+            for phase, seconds in timings.items():
+                samples.setdefault(phase_name(phase), []).append(seconds)
+    return {phase: statistics.median(seconds) for phase, seconds in samples.items()}
+
+
+def scale_day(day, parts=None, steps=6, factor=2, repeats=3, max_seconds=5.0, seed=0):
+    """Solve generated inputs of geometrically growing size and fit each
+    phase's growth exponent.
+
+    The series stops early once one input takes longer than `max_seconds` to
+    solve in total, so the slow days give fewer points instead of hanging."""
+    puzzle_day = Day(day)
+    parts = select_parts(puzzle_day, parts)
+    points = {}
+    size = START_SIZES[day]
+    for _ in range(steps):
+        text = generate_text(day, size, seed)
+        medians = measure(puzzle_day, text, parts, repeats)
+        for phase, seconds in medians.items():
+            points.setdefault(phase, []).append(
+                {"size": size, "bytes": len(text), "seconds": seconds}
+            )
+        if sum(medians.values()) > max_seconds:
+            break
+        size = max(size + 1, round(size * factor))
+    results = []
+    for phase, phase_points in points.items():
+        exponent = fit_exponent(phase_points)
+        expected = expected_exponent(day, phase)
+        results.append(
+            {
+                "day": day,
+                "phase": phase,
+                "exponent": exponent,
+                "expected": expected,
+                "points": phase_points,
+            }
+        )
+    return results
+
+
+def flag(result, tolerance):
+    return result["exponent"] is not None and result["exponent"] > result["expected"] + tolerance
+
+
+def print_scaling(results):
+    print(
+        f"{'DAY':>3}  {'PHASE':<6}  {'POINTS':>6}  {'SIZES':>19}  "
+        f"{'SLOWEST':>11}  {'EXPONENT':>8}  {'EXPECTED':>8}"
+    )
+    for result in results:
+        if "error" in result:
+            print(f"{result['day']:>3}  {'':<6}  error  {result['error']}")
+            continue
+        points = result["points"]
+        span = f"{points[0]['size']}-{points[-1]['size']}"
+        exponent = "-" if result["exponent"] is None else f"{result['exponent']:.2f}"
+        note = "  WORSE THAN EXPECTED" if result["flagged"] else ""
+        print(
+            f"{result['day']:>3}  {result['phase']:<6}  {len(points):>6}  {span:>19}  "
+            f"{points[-1]['seconds']:>10.6f}s  {exponent:>8}  "
+            f"{result['expected']:>8.1f}{note}"
+        )
+
+
+def command_scale(args):
+    if args.steps < 2 or args.factor <= 1 or args.repeats < 1:
+        sys.exit("--steps must be at least 2, --factor above 1 and --repeats at least 1")
+    days = args.days or sorted(START_SIZES)
+    missing = [day for day in days if day not in START_SIZES]
+    if missing:
+        sys.exit(f"No scaling series for day(s) {', '.join(map(str, missing))}")
+    results = []
+    for day in days:
+        try:
+            day_results = scale_day(
+                day, args.parts, args.steps, args.factor, args.repeats, args.max_seconds,
+                args.seed,
+            )
+        except Exception as error:
+            day_results = [{"day": day, "error": f"{type(error).__name__}: {error}"}]
+        for result in day_results:
+            if "error" not in result:
+                result["flagged"] = flag(result, args.tolerance)
+        results.extend(day_results)
+    print_scaling(results)
+    if args.json:
+        meta = metadata(args.repeats, 0)
+        meta.update(
+            {
+                "steps": args.steps,
+                "factor": args.factor,
+                "max_seconds": args.max_seconds,
+                "seed": args.seed,
+                "tolerance": args.tolerance,
+            }
+        )
+        with open(args.json, "w") as file:
+            json.dump({"meta": meta, "results": results}, file, indent=2, sort_keys=True)
+    return 0
+
+
+def add_parser(commands):
+    scale = commands.add_parser(
+        "scale", help="Fit runtime growth over generated inputs of increasing size"
+    )
+    scale.add_argument("days", type=int, nargs="*", help="Days to scale (default: all generated)")
+    scale.add_argument(
+        "-P", "--part", dest="parts", type=int, choices=PARTS, action="append",
+        help="Only run this part (repeatable)",
+    )
+    scale.add_argument("--steps", help="Sizes in each series", type=int, default=6)
+    scale.add_argument("--factor", help="Growth between sizes", type=float, default=2)
+    scale.add_argument("-r", "--repeats", help="Runs per size (median kept)", type=int, default=3)
+    scale.add_argument(
+        "--max-seconds", type=float, default=5.0,
+        help="Stop a day's series after an input slower than this",
+    )
+    scale.add_argument(
+        "--tolerance", type=float, default=0.3,
+        help="Flag exponents this far above the expected one",
+    )
+    scale.add_argument("--seed", type=int, default=0)
+    scale.add_argument("--json", help="Write the series and fits to this JSON file")
+    scale.set_defaults(func=command_scale)
@@ -0,0 +1,210 @@
+"""A long-running solver that keeps every day imported between requests.
+
+    python -m aoc serve                      # http://127.0.0.1:8022
+    python -m aoc serve --socket /tmp/aoc.sock
+
+    curl -s localhost:8022/solve -d '{"day": 9, "parts": [1], "input": "R 4\\nU 4\\n"}'
+    curl -s --unix-socket /tmp/aoc.sock http://aoc/solve -d '{"day": 1, "path": "01/input.txt"}'
+
+POST /solve takes a JSON object with "day", optionally "parts", and one of
+"input" (the text), "path" (a file the server reads) or "sample": true. The
+reply carries the answers, each phase's time and the request's total time
+(also sent as a Server-Timing header). GET /days lists what is loaded.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+from aoc.days import PARTS, Day, available_days
+from aoc.inputs import PuzzleInput
+from aoc.runner import phase_name, select_parts
+
+
+class RequestError(Exception):
+    pass
+
+
+def load_days():
+    """Import every day up front; returns ({day: Day}, {day: import error})."""
+    loaded, failed = {}, {}
+    for day in available_days():
+        try:
+            loaded[day] = Day(day)
+        except Exception as error:
+            failed[day] = f"{type(error).__name__}: {error}"
+    return loaded, failed
+
+
+def request_parts(puzzle_day, request):
+    parts = request.get("parts")
+    if parts is not None and (
+        not isinstance(parts, list)
+        or not all(type(part) is int and part in PARTS for part in parts)
+    ):
+        raise RequestError(f'"parts" must be a list of parts out of {list(PARTS)}')
+    return select_parts(puzzle_day, parts)
+
+
+def request_input(puzzle_day, request, parts):
+    if request.get("sample"):
+        if len({puzzle_day.sample_input(part) for part in parts}) > 1:
+            raise RequestError("This day's parts have different samples; ask for one part")
+        return puzzle_day.sample_input(parts[0])
+    for key in ("path", "input"):
+        if key in request and not isinstance(request[key], str):
+            raise RequestError(f'"{key}" must be a string')
+    if "path" in request:
+        if not os.path.isfile(request["path"]):
+            raise RequestError(f"No such input file: {request['path']}")
+        return puzzle_day.prepare(PuzzleInput.from_file(request["path"]))
+    if "input" in request:
+        return puzzle_day.prepare(PuzzleInput.from_text(request["input"]))
+    raise RequestError('Give one of "input", "path" or "sample"')
+
+
+def solve_request(days, failed, request):
+    """Answer one /solve request; raises RequestError for bad requests."""
+    if not isinstance(request, dict) or not isinstance(request.get("day"), int):
+        raise RequestError('Expected a JSON object with an integer "day"')
+    day = request["day"]
+    if day in failed:
+        raise RequestError(f"Day {day} failed to import: {failed[day]}")
+    if day not in days:
+        raise RequestError(f"No day {day}")
+    puzzle_day = days[day]
+    parts = request_parts(puzzle_day, request)
+    if not parts:
+        raise RequestError(f"Day {day} has none of the requested parts")
+    input_text = request_input(puzzle_day, request, parts)
+    answers, timings = puzzle_day.solve(input_text, parts)
+    return {
+        "day": day,
+        "answers": {str(part): answers[part] for part in parts},
+        "timings": {phase_name(phase): seconds for phase, seconds in timings.items()},
+    }
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    # The server sets `days` and `failed` on itself; see make_server().
+
+    # Keep-alive, so tooling pays for a connection once rather than per
+    # request; headers and body go out as two writes, so no Nagle delay.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def send_json(self, status, body, timed=False):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if timed:
+            timings = body.get("timings", {})
+            metrics = [
+                f"{phase.replace(' ', '')};dur={seconds * 1000:.3f}"
+                for phase, seconds in timings.items()
+            ]
+            metrics.append(f"total;dur={body['seconds'] * 1000:.3f}")
+            self.send_header("Server-Timing", ", ".join(metrics))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != "/days":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        days = {
+            str(day): {"parts": puzzle_day.parts}
+            for day, puzzle_day in self.server.days.items()
+        }
+        days.update({str(day): {"error": error} for day, error in self.server.failed.items()})
+        self.send_json(200, days)
+
+    def do_POST(self):
+        started = perf_counter()
+        # Read the body even when refusing it, so a kept-alive connection's
+        # next request starts where it should.
+        payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != "/solve":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            request = json.loads(payload or b"null")
+            body = solve_request(self.server.days, self.server.failed, request)
+            status = 200
+        except (RequestError, ValueError) as error:
+            body, status = {"error": str(error)}, 400
+        except Exception as error:
+            body, status = {"error": f"{type(error).__name__}: {error}"}, 500
+        body["seconds"] = perf_counter() - started
+        self.send_json(status, body, timed=True)
+
+    def address_string(self):
+        # Unix socket peers have no (host, port).
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if not self.server.verbose:
+            return
+        super().log_message(format, *args)
+
+
+class UnixSolverHandler(SolverHandler):
+    disable_nagle_algorithm = False  # TCP_NODELAY is a TCP option
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        # BaseHTTPRequestHandler reads these for its headers.
+        self.server_name, self.server_port = "localhost", 0
+
+
+def make_server(port=8022, socket_path=None, verbose=False):
+    if socket_path:
+        server = ThreadingUnixHTTPServer(socket_path, UnixSolverHandler)
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", port), SolverHandler)
+    server.days, server.failed = load_days()
+    server.verbose = verbose
+    return server
+
+
+def command_serve(args):
+    server = make_server(args.port, args.socket, args.verbose)
+    where = args.socket or f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Serving days {', '.join(map(str, server.days))} on {where}", file=sys.stderr)
+    for day, error in server.failed.items():
+        print(f"Day {day} unavailable: {error}", file=sys.stderr)
+    # Days 11 and 12 print progress while they work; with requests on several
+    # threads at once there is no sensible place for it to go.
+    sys.stdout = open(os.devnull, "w")
+    # Shut down (and remove the socket) on `kill` as well as on Ctrl-C.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+def add_parser(commands):
+    serve = commands.add_parser(
+        "serve", help="Keep every day loaded and answer solve requests over HTTP"
+    )
+    serve.add_argument("--port", type=int, default=8022, help="Localhost TCP port")
+    serve.add_argument("--socket", help="Listen on this Unix socket instead")
+    serve.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    serve.set_defaults(func=command_serve)
@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+from datetime import datetime
+
+from aoc.days import PARTS, Day, day_path, quiet
+from aoc.inputs import PuzzleInput
+from aoc.runner import format_answer, phase_name, select_parts
+
+WATCHED = ("input.txt", "sample.txt")
+
+
+class WatchedFile:
+    """One input file and the digest of the content last solved from it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.signature = None
+        self.digest = None
+
+    def changed(self):
+        """True when the file's content differs from the last call's. Only a
+        new mtime or size gets it hashed, and a save that leaves the bytes as
+        they were (or a touch) doesn't count."""
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        digest = signature and PuzzleInput.from_file(self.path).digest()
+        if digest == self.digest:
+            return False
+        self.digest = digest
+        return True
+
+
+def solve_file(puzzle_day, watched, parts, engine=None):
+    """Solve the parts of one changed file and print the result. The day's
+    module stays imported between calls, so only parsing and the parts run."""
+    stamp = datetime.now().strftime("%H:%M:%S")
+    name = os.path.relpath(watched.path)
+    if watched.digest is None:
+        print(f"[{stamp}] {name} removed")
+        return
+    if not watched.signature[1]:
+        print(f"[{stamp}] {name} is empty")
+        return
+    print(f"[{stamp}] {name} {watched.digest[:12]}")
+    try:
+        source = puzzle_day.prepare(PuzzleInput.from_file(watched.path))
+        with quiet():
+            answers, timings = puzzle_day.solve(source, parts, engine=engine)
+    except Exception as error:
+        print(f"    {type(error).__name__}: {error}")
+        return
+    for phase, seconds in timings.items():
+        row = {"kind": "input"}
+        if phase in answers:
+            row["answer"] = answers[phase]
+        print(f"    {phase_name(phase):<6}  {seconds:>10.6f}s  {format_answer(row)}")
+
+
+def command_watch(args):
+    puzzle_day = Day(args.day)
+    if args.engine:
+        try:
+            puzzle_day.puzzle_class(args.engine)
+        except ValueError as error:
+            sys.exit(str(error))
+    parts = select_parts(puzzle_day, args.parts)
+    paths = args.files or [day_path(args.day, name) for name in WATCHED]
+    files = [WatchedFile(path) for path in paths]
+    print(f"Watching {', '.join(os.path.relpath(path) for path in paths)} (Ctrl-C to stop)")
+    try:
+        while True:
+            for watched in files:
+                if watched.changed():
+                    solve_file(puzzle_day, watched, parts, args.engine)
+            sys.stdout.flush()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+def add_parser(commands):
+    watch = commands.add_parser(
+        "watch", help="Re-solve a day whenever its input.txt or sample.txt changes"
+    )
+    watch.add_argument("day", type=int, help="Day to watch")
+    watch.add_argument(
+        "files", nargs="*", help="Files to watch instead of the day's input.txt and sample.txt"
+    )
+    watch.add_argument(
+        "-P", "--part", dest="parts", type=int, choices=PARTS, action="append",
+        help="Only solve this part (repeatable)",
+    )
+    watch.add_argument("-e", "--engine", help="Solve with this engine from the day's ENGINES")
+    watch.add_argument(
+        "--interval", type=float, default=0.25, help="Seconds between checks for changes"
+    )
+    watch.set_defaults(func=command_watch)